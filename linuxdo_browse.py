@@ -7,12 +7,42 @@ LinuxDO 浏览签到脚本
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import sys
-import traceback
+import time
+from pathlib import Path
 
 from loguru import logger
 
+# 同时运行的账号数上限：每个账号会启动一个浏览器实例，避免在 GitHub Runner 上内存耗尽
+MAX_CONCURRENT_ACCOUNTS = max(1, int(os.environ.get("LINUXDO_CONCURRENCY", "3")))
+
+# 所有账号共享的访问限速（令牌桶）：平均每秒请求数和允许的突发数
+BROWSE_RPS = float(os.environ.get("LINUXDO_RPS", "2"))
+BROWSE_BURST = int(os.environ.get("LINUXDO_BURST", "4"))
+
+# 是否让所有账号共享一个浏览器进程（每个账号使用独立的浏览器上下文）
+SHARE_BROWSER = os.environ.get("LINUXDO_SHARE_BROWSER", "true").lower() == "true"
+
+# 记录每个账号上次浏览成功的时间，与 Cookie 缓存放在同一目录（CI 中一起缓存）
+LAST_SUCCESS_FILE = Path(os.environ.get("LINUXDO_COOKIE_CACHE_DIR", ".linuxdo_cookies")) / "last_success.json"
+
+# 距离上次成功不足该小时数的账号本次跳过（避免重跑工作流时重复浏览），0 表示不跳过
+MIN_INTERVAL_HOURS = float(os.environ.get("LINUXDO_MIN_INTERVAL_HOURS", "4"))
+
+# 单个账号各阶段的超时（秒）：登录每次尝试的上限；浏览阶段在账号浏览时长之外额外允许的时间
+LOGIN_TIMEOUT = float(os.environ.get("LINUXDO_LOGIN_TIMEOUT", "180"))
+BROWSE_TIMEOUT = float(os.environ.get("LINUXDO_BROWSE_TIMEOUT", "600"))
+
+# 所有账号的总时长上限（分钟），默认留出余量避开 GitHub Actions 6 小时的任务上限
+JOB_BUDGET_MINUTES = float(os.environ.get("LINUXDO_JOB_BUDGET_MINUTES", "330"))
+
+# 日志分隔线
+_BANNER = "=" * 50
+_SEPARATOR = "-" * 40
+
 
 def setup_logging():
     """配置日志"""
@@ -24,13 +54,296 @@ def setup_logging():
         logger.add(sys.stdout, level="INFO", format="{time:HH:mm:ss} | {level} | {message}")
 
 
+def log_cache_state():
+    """记录浏览器缓存目录状态，便于在 CI 日志中发现缓存失效"""
+    browsers_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if not browsers_path:
+        return
+
+    if os.path.isdir(browsers_path) and os.listdir(browsers_path):
+        logger.info(f"浏览器缓存命中: {browsers_path}")
+    else:
+        logger.warning(f"浏览器缓存未命中: {browsers_path}")
+
+
+def _account_key(account) -> str:
+    """生成账号的唯一标识（用于去重和记录上次成功时间）"""
+    if account.username:
+        return account.username
+
+    cookies = account.cookies
+    if isinstance(cookies, dict):
+        cookies = json.dumps(cookies, sort_keys=True)
+    return "cookie:" + hashlib.sha256(str(cookies).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_last_success() -> dict[str, float]:
+    """读取各账号上次浏览成功的时间戳"""
+    try:
+        with open(LAST_SUCCESS_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"读取上次成功记录失败: {e}")
+        return {}
+
+
+def _save_last_success(last_success: dict[str, float]) -> None:
+    """保存各账号上次浏览成功的时间戳"""
+    try:
+        LAST_SUCCESS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LAST_SUCCESS_FILE, "w", encoding="utf-8") as f:
+            f.write(json.dumps(last_success))
+    except Exception as e:
+        logger.warning(f"保存上次成功记录失败: {e}")
+
+
+async def _process_account(
+    i: int,
+    account,
+    total: int,
+    http_transport=None,
+    rate_limiter=None,
+    last_success: dict[str, float] | None = None,
+) -> str:
+    """处理单个账号：登录（失败重试）后浏览帖子
+
+    Args:
+        i: 账号序号
+        account: LinuxDO 账号配置
+        total: 账号总数（仅用于日志）
+        http_transport: 所有账号共享的 HTTP 传输层（复用连接池）
+        rate_limiter: 所有账号共享的访问限速器
+        last_success: 上次成功时间记录，浏览成功后更新
+
+    Returns:
+        用于汇总通知的结果行。账号级别的结果只通过返回值汇总，
+        不要在这里（或 LinuxDOAdapter.checkin 中）单独发送通知，
+        由 main() 统一合并为一条推送。
+    """
+    from platforms.linuxdo import LinuxDOAdapter
+
+    name = account.get_display_name(i)
+    has_cookies = bool(account.cookies)
+    has_credentials = bool(account.username and account.password)
+    logger.info(f"处理账号 [{i + 1}/{total}]: {name}")
+
+    # 打印账号配置（隐藏敏感信息）
+    logger.info(
+        "[{}] 有 Cookie: {} | 有用户名密码: {} | 浏览时长: {} 分钟",
+        name,
+        has_cookies,
+        has_credentials,
+        account.browse_minutes,
+    )
+
+    # 获取 cookies
+    cookies = account.cookies if has_cookies else None
+
+    # 登录重试配置：每次重试都使用全新的浏览器实例（共享浏览器时为全新的上下文）
+    max_login_retries = 5
+    retry_delays = [5, 10, 15, 20, 25]  # 每次重试前等待的秒数
+
+    login_success = False
+    adapter = None
+    last_error = None
+
+    for attempt in range(1, max_login_retries + 1):
+        # 每次尝试都创建新的 adapter（新浏览器实例或新上下文）
+        adapter = LinuxDOAdapter(
+            username=account.username,
+            password=account.password,
+            cookies=cookies,
+            account_name=name,
+            browse_minutes=account.browse_minutes,
+            http_transport=http_transport,
+            rate_limiter=rate_limiter,
+            share_browser=SHARE_BROWSER,
+        )
+
+        try:
+            logger.info(f"[{name}] 登录尝试 {attempt}/{max_login_retries}...")
+            login_success = await asyncio.wait_for(adapter.login(), timeout=LOGIN_TIMEOUT)
+
+            if login_success:
+                logger.success(f"[{name}] 登录成功！方式: {adapter._login_method}")
+                break
+            else:
+                logger.warning(f"[{name}] 登录尝试 {attempt}/{max_login_retries} 失败")
+
+        except asyncio.TimeoutError as e:
+            last_error = e
+            logger.warning(f"[{name}] 登录尝试 {attempt}/{max_login_retries} 超时（{LOGIN_TIMEOUT:g} 秒）")
+
+        except Exception as e:
+            last_error = e
+            logger.warning(f"[{name}] 登录尝试 {attempt}/{max_login_retries} 出错: {e}")
+
+        # 如果不是最后一次尝试，关闭浏览器并等待后重试
+        if attempt < max_login_retries:
+            try:
+                await adapter.cleanup()
+                logger.info(f"[{name}] 浏览器已关闭")
+            except Exception as e:
+                logger.warning(f"[{name}] 清理资源时出错: {e}")
+
+            wait_time = retry_delays[attempt - 1]
+            logger.info(f"[{name}] 等待 {wait_time} 秒后打开新浏览器重试...")
+            await asyncio.sleep(wait_time)
+            adapter = None
+
+    # 检查最终登录结果
+    if not login_success:
+        logger.error(f"账号 {name} 登录失败，已重试 {max_login_retries} 次")
+        if adapter:
+            try:
+                await adapter.cleanup()
+            except Exception:
+                pass
+        if isinstance(last_error, asyncio.TimeoutError):
+            return f"⏱ {name}: 登录超时"
+        error_msg = str(last_error)[:50] if last_error else "登录失败"
+        return f"❌ {name}: {error_msg}"
+
+    # 登录成功，执行浏览
+    try:
+        logger.info(f"[{name}] 开始浏览帖子...")
+        browse_timeout = account.browse_minutes * 60 + BROWSE_TIMEOUT
+        result = await asyncio.wait_for(adapter.checkin(), timeout=browse_timeout)
+
+        logger.success(f"[{name}] 完成: {result.message}")
+        if last_success is not None:
+            last_success[_account_key(account)] = time.time()
+        return f"✅ {name}: {result.message}"
+
+    except asyncio.TimeoutError:
+        logger.error(f"账号 {name} 浏览超时（{browse_timeout:g} 秒）")
+        return f"⏱ {name}: 浏览超时"
+    except Exception as e:
+        logger.opt(exception=True).error("账号 {} 浏览出错: {}", name, e)
+        return f"❌ {name}: {str(e)[:50]}"
+    finally:
+        try:
+            await adapter.cleanup()
+        except Exception as e:
+            logger.warning(f"[{name}] 清理资源时出错: {e}")
+
+
+async def _run_enabled_accounts(enabled: list, total: int, last_success: dict[str, float]) -> list[str]:
+    """并发处理所有启用浏览的账号
+
+    Args:
+        enabled: (原始序号, 账号配置) 列表，序号用于显示名称
+        total: 配置中的账号总数（仅用于日志）
+        last_success: 上次成功时间记录，浏览成功的账号会被更新
+
+    Returns:
+        与 enabled 顺序一致的结果行列表。正常返回时共享浏览器仍未关闭，
+        由调用方在发送通知的同时关闭（见 _send_results）。
+    """
+    # 配置有效后再导入浏览器/HTTP 相关模块，配置错误时可以快速退出
+    try:
+        import httpx
+
+        from platforms.linuxdo import close_shared_browser
+        from utils.rate_limiter import TokenBucket
+    except ImportError as e:
+        logger.opt(exception=True).error("模块导入失败: {}", e)
+        sys.exit(1)
+
+    # 并发处理所有账号：各账号浏览互不依赖，单个账号失败不影响其它账号
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ACCOUNTS)
+
+    # 所有账号共享一个 HTTP/2 连接池，避免每个账号重复 TCP/TLS 握手
+    http_transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+    rate_limiter = TokenBucket(rate=BROWSE_RPS, burst=BROWSE_BURST)
+
+    async def _guarded(i: int, account) -> tuple[int, str]:
+        async with semaphore:
+            try:
+                return i, await _process_account(i, account, total, http_transport, rate_limiter, last_success)
+            except Exception as e:
+                name = account.get_display_name(i)
+                logger.error(f"账号 {name} 处理异常: {e}")
+                return i, f"❌ {name}: {str(e)[:50]}"
+
+    logger.info(_SEPARATOR)
+    logger.info(f"并发账号数上限: {MAX_CONCURRENT_ACCOUNTS}，总时长上限: {JOB_BUDGET_MINUTES:g} 分钟")
+
+    # 按完成顺序收集结果：先完成的账号立即记录，超出总时长时取消剩余账号，已完成的结果仍会发送通知
+    tasks = [asyncio.create_task(_guarded(i, account)) for i, account in enabled]
+    outcomes: dict[int, str] = {}
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=JOB_BUDGET_MINUTES * 60):
+            i, line = await next_done
+            outcomes[i] = line
+            logger.info(f"[{len(outcomes)}/{len(tasks)}] {line}")
+    except asyncio.TimeoutError:
+        logger.error(f"超出总时长上限 {JOB_BUDGET_MINUTES:g} 分钟，取消剩余 {len(tasks) - len(outcomes)} 个账号")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if not task.cancelled():
+                i, line = task.result()
+                outcomes.setdefault(i, line)
+    except BaseException:
+        await close_shared_browser()
+        raise
+    finally:
+        await http_transport.aclose()
+
+    # 通知中仍按配置顺序排列
+    return [outcomes.get(i, f"⏱ {account.get_display_name(i)}: 超出总时长未完成") for i, account in enabled]
+
+
+async def _send_results(results: list[str], cleanup=None) -> None:
+    """发送汇总通知，同时执行收尾清理
+
+    通知在线程中发送，与 cleanup（如关闭共享浏览器）并行，
+    节省一次通知请求的往返时间。
+
+    Args:
+        results: 结果行列表
+        cleanup: 可选的收尾协程
+    """
+    from utils.notify import push_message_batch
+
+    notify_task = None
+    logger.info(_SEPARATOR)
+    if results:
+        logger.info("发送通知:\n" + "\n".join(results))
+        notify_task = asyncio.create_task(asyncio.to_thread(push_message_batch, "LinuxDO 浏览签到结果", results))
+    else:
+        logger.warning("没有任何结果，跳过通知")
+
+    if cleanup is not None:
+        try:
+            await cleanup
+        except Exception as e:
+            logger.warning(f"清理资源时出错: {e}")
+
+    if notify_task is not None:
+        try:
+            await notify_task
+            logger.success("通知发送成功")
+        except Exception as e:
+            logger.warning(f"通知发送失败: {e}")
+
+
 async def main():
     """主函数"""
     setup_logging()
 
-    logger.info("=" * 50)
+    logger.info(_BANNER)
     logger.info("LinuxDO 浏览签到脚本启动")
-    logger.info("=" * 50)
+    logger.info(_BANNER)
 
     # 打印环境信息
     logger.info(f"Python 版本: {sys.version}")
@@ -38,6 +351,7 @@ async def main():
     logger.info(f"BROWSER_ENGINE: {os.environ.get('BROWSER_ENGINE', '未设置')}")
     logger.info(f"CI: {os.environ.get('CI', '未设置')}")
     logger.info(f"GITHUB_ACTIONS: {os.environ.get('GITHUB_ACTIONS', '未设置')}")
+    log_cache_state()
 
     # 检查 LINUXDO_ACCOUNTS 环境变量
     accounts_str = os.environ.get("LINUXDO_ACCOUNTS")
@@ -49,16 +363,13 @@ async def main():
     # 打印账号配置（隐藏敏感信息）
     logger.info(f"LINUXDO_ACCOUNTS 长度: {len(accounts_str)} 字符")
 
-    # 导入模块
+    # 导入模块（仅轻量模块，浏览器相关的重模块在配置校验通过后再导入）
     try:
-        from platforms.linuxdo import LinuxDOAdapter
         from utils.config import AppConfig
-        from utils.notify import push_message
 
         logger.info("模块导入成功")
     except ImportError as e:
-        logger.error(f"模块导入失败: {e}")
-        logger.error(traceback.format_exc())
+        logger.opt(exception=True).error("模块导入失败: {}", e)
         sys.exit(1)
 
     # 加载配置
@@ -66,8 +377,7 @@ async def main():
         config = AppConfig.load_from_env()
         logger.info(f"配置加载成功，共 {len(config.linuxdo_accounts)} 个账号")
     except Exception as e:
-        logger.error(f"配置加载失败: {e}")
-        logger.error(traceback.format_exc())
+        logger.opt(exception=True).error("配置加载失败: {}", e)
         sys.exit(1)
 
     if not config.linuxdo_accounts:
@@ -75,116 +385,53 @@ async def main():
         logger.error("请检查 LINUXDO_ACCOUNTS 的 JSON 格式是否正确")
         sys.exit(1)
 
+    # 预先过滤关闭浏览、重复配置以及最近已成功的账号，调度阶段只处理真正需要启动浏览器的账号
+    total = len(config.linuxdo_accounts)
+    force_run = os.environ.get("FORCE_RUN") == "1"
+    last_success = _load_last_success()
+    seen = set()
+    enabled = []
     results = []
-
     for i, account in enumerate(config.linuxdo_accounts):
-        logger.info("-" * 40)
-        logger.info(f"处理账号 [{i + 1}/{len(config.linuxdo_accounts)}]: {account.get_display_name(i)}")
-
-        # 打印账号配置（隐藏敏感信息）
-        has_cookies = bool(account.cookies)
-        has_credentials = bool(account.username and account.password)
-        logger.info(f"  - 有 Cookie: {has_cookies}")
-        logger.info(f"  - 有用户名密码: {has_credentials}")
-        logger.info(f"  - 浏览时长: {account.browse_minutes} 分钟")
-
-        # 获取 cookies
-        cookies = account.cookies if account.cookies else None
-
-        # 登录重试配置：每次重试都打开新浏览器实例
-        max_login_retries = 5
-        retry_delays = [5, 10, 15, 20, 25]  # 每次重试前等待的秒数
-        
-        login_success = False
-        adapter = None
-        last_error = None
-        
-        for attempt in range(1, max_login_retries + 1):
-            # 每次尝试都创建新的 adapter（新浏览器实例）
-            adapter = LinuxDOAdapter(
-                username=account.username,
-                password=account.password,
-                cookies=cookies,
-                account_name=account.get_display_name(i),
-                browse_minutes=account.browse_minutes,
-            )
-            
-            try:
-                logger.info(f"登录尝试 {attempt}/{max_login_retries}...")
-                login_success = await adapter.login()
-                
-                if login_success:
-                    logger.success(f"登录成功！方式: {adapter._login_method}")
-                    break
-                else:
-                    logger.warning(f"登录尝试 {attempt}/{max_login_retries} 失败")
-                    
-            except Exception as e:
-                last_error = e
-                logger.warning(f"登录尝试 {attempt}/{max_login_retries} 出错: {e}")
-            
-            # 如果不是最后一次尝试，关闭浏览器并等待后重试
-            if attempt < max_login_retries:
-                try:
-                    await adapter.cleanup()
-                    logger.info("浏览器已关闭")
-                except Exception as e:
-                    logger.warning(f"清理资源时出错: {e}")
-                
-                wait_time = retry_delays[attempt - 1]
-                logger.info(f"等待 {wait_time} 秒后打开新浏览器重试...")
-                await asyncio.sleep(wait_time)
-                adapter = None
-        
-        # 检查最终登录结果
-        if not login_success:
-            error_msg = str(last_error)[:50] if last_error else "登录失败"
-            logger.error(f"账号 {account.get_display_name(i)} 登录失败，已重试 {max_login_retries} 次")
-            results.append(f"❌ {account.get_display_name(i)}: {error_msg}")
-            if adapter:
-                try:
-                    await adapter.cleanup()
-                except Exception:
-                    pass
-            continue
-        
-        # 登录成功，执行浏览
-        try:
-            logger.info("开始浏览帖子...")
-            result = await adapter.checkin()
-
-            results.append(f"✅ {account.get_display_name(i)}: {result.message}")
-            logger.success(f"完成: {result.message}")
+        name = account.get_display_name(i)
+        key = _account_key(account)
+        if not account.browse_linuxdo:
+            logger.info(f"[{name}] 跳过浏览帖子")
+            results.append(f"⏭️ {name}: 已关闭浏览")
+        elif key in seen:
+            logger.warning(f"[{name}] 账号重复配置，跳过")
+        elif (
+            not force_run
+            and MIN_INTERVAL_HOURS > 0
+            and time.time() - last_success.get(key, 0) < MIN_INTERVAL_HOURS * 3600
+        ):
+            logger.info(f"[{name}] {MIN_INTERVAL_HOURS:g} 小时内已浏览成功，跳过（设置 FORCE_RUN=1 强制执行）")
+            results.append(f"⏭️ {name}: 近期已完成")
+        else:
+            enabled.append((i, account))
+        seen.add(key)
 
-        except Exception as e:
-            logger.error(f"账号 {account.get_display_name(i)} 浏览出错: {e}")
-            logger.error(traceback.format_exc())
-            results.append(f"❌ {account.get_display_name(i)}: {str(e)[:50]}")
-        finally:
-            try:
-                await adapter.cleanup()
-            except Exception as e:
-                logger.warning(f"清理资源时出错: {e}")
+    if enabled:
+        from platforms.linuxdo import close_shared_browser
 
-    # 发送通知
-    logger.info("-" * 40)
-    if results:
-        title = "LinuxDO 浏览签到结果"
-        content = "\n".join(results)
-        logger.info(f"发送通知:\n{content}")
-
-        try:
-            push_message(title, content)
-            logger.success("通知发送成功")
-        except Exception as e:
-            logger.warning(f"通知发送失败: {e}")
+        results.extend(await _run_enabled_accounts(enabled, total, last_success))
+        _save_last_success(last_success)
+        # 发送通知的同时关闭共享浏览器
+        await _send_results(results, close_shared_browser())
     else:
-        logger.warning("没有任何结果，跳过通知")
+        logger.warning("没有需要浏览的账号，无需启动浏览器")
+        await _send_results(results)
 
-    logger.info("=" * 50)
+    logger.info(_BANNER)
     logger.info("LinuxDO 浏览签到脚本完成")
-    logger.info("=" * 50)
+    logger.info(_BANNER)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Linux 上使用 uvloop（libuv 实现的事件循环，见 pyproject 依赖），其它平台使用默认事件循环
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -15,6 +15,7 @@ Requirements:
 
 import argparse
 import asyncio
+import functools
 import gc
 import sys
 from datetime import datetime, timedelta, timezone
@@ -162,6 +163,14 @@ async def run_checkin(args: argparse.Namespace) -> int:
     else:
         await manager.run_all()
 
+    # 汇总通知只依赖签到结果：立即在后台线程发送，与下方导出文件并行，不阻塞事件循环
+    # （run_in_executor 立即提交到线程池；asyncio.to_thread 要等事件循环下次调度才开始）
+    summary_task: asyncio.Future | None = None
+    if not args.no_notify:
+        summary_task = asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(manager.send_summary_notification, force=args.force_notify)
+        )
+
     newapi_export_path: str | None = None
     failed_sites_export_path: str | None = None
 
@@ -179,14 +188,16 @@ async def run_checkin(args: argparse.Namespace) -> int:
     # 显示结果
     logger.info(f"签到完成 - 成功: {manager.success_count}, 失败: {manager.failed_count}, 跳过: {manager.skipped_count}")
 
-    # 发送通知
-    if not args.no_notify:
-        manager.send_summary_notification(force=args.force_notify)
+    # 发送通知（附件邮件依赖导出文件，与仍在进行的汇总通知并行发送）
+    if summary_task is not None:
+        notify_tasks = [summary_task]
         if not args.platform or args.platform == "newapi":
-            manager.send_newapi_accounts_export_email(
+            notify_tasks.append(asyncio.to_thread(
+                manager.send_newapi_accounts_export_email,
                 newapi_export_path,
                 failed_sites_export_path,
-            )
+            ))
+        await asyncio.gather(*notify_tasks)
 
     # 给异步子进程回收留一点缓冲，降低 interpreter 退出时 event loop 噪音
     await asyncio.sleep(0.2)
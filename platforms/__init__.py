@@ -2,18 +2,28 @@
 平台适配器模块
 
 提供多平台签到支持的适配器实现。
+
+各适配器依赖的浏览器库（patchright / nodriver / DrissionPage 等）较重，
+这里按需导入：只有访问对应名称时才加载其模块，
+因此 `from platforms.linuxdo import LinuxDOAdapter` 不会连带导入其它平台。
 """
 
+import importlib
+
 from platforms.base import BasePlatformAdapter, CheckinResult, CheckinStatus
-from platforms.anyrouter import AnyRouterAdapter
-from platforms.duckcoding import DuckCodingAdapter
-from platforms.elysiver import ElysiverAdapter
-from platforms.kfcapi import KFCAPIAdapter
-from platforms.linuxdo import LinuxDOAdapter
-from platforms.neb import NEBAdapter
-from platforms.runanytime import RunAnytimeAdapter
-from platforms.wong import WongAdapter
-from platforms.manager import PlatformManager
+
+# 名称 -> 所在模块（按需导入）
+_LAZY_EXPORTS = {
+    "AnyRouterAdapter": "platforms.anyrouter",
+    "DuckCodingAdapter": "platforms.duckcoding",
+    "ElysiverAdapter": "platforms.elysiver",
+    "KFCAPIAdapter": "platforms.kfcapi",
+    "LinuxDOAdapter": "platforms.linuxdo",
+    "NEBAdapter": "platforms.neb",
+    "RunAnytimeAdapter": "platforms.runanytime",
+    "WongAdapter": "platforms.wong",
+    "PlatformManager": "platforms.manager",
+}
 
 __all__ = [
     "BasePlatformAdapter",
@@ -29,3 +39,17 @@ __all__ = [
     "WongAdapter",
     "PlatformManager",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -20,7 +20,10 @@ import hashlib
 import json
 import os
 import random
+import re
+import sys
 import time
+from http.cookiejar import CookieJar
 from pathlib import Path
 
 import httpx
@@ -29,18 +32,195 @@ from loguru import logger
 
 from platforms.base import BasePlatformAdapter, CheckinResult, CheckinStatus
 from utils.browser import BrowserManager, get_browser_engine
+from utils.rate_limiter import TokenBucket
+from utils.retry import retry_decorator
+
+# 优先使用 orjson（C 实现）解析/序列化 JSON，未安装时回退到标准库
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Cloudflare 挑战页面的标题特征
+_CF_TITLE_RE = re.compile(
+    r"just a moment|checking your browser|please wait|verifying|something went wrong",
+    re.IGNORECASE,
+)
+
+# 登录错误提示元素：按优先级逐个检查（宽泛的 [class*="error"] 放最后），返回第一个有文字的元素内容
+_LOGIN_ERROR_SELECTORS = [
+    ".alert-error",
+    ".error",
+    "#error-message",
+    ".flash-error",
+    ".login-error",
+    "#login-error",
+    ".ember-view.alert.alert-error",
+    '[class*="error"]',
+]
+_LOGIN_ERROR_JS = f"""
+(function() {{
+    for (const sel of {json.dumps(_LOGIN_ERROR_SELECTORS)}) {{
+        const el = document.querySelector(sel);
+        if (el && el.innerText && el.innerText.trim()) {{
+            return el.innerText.trim();
+        }}
+    }}
+    return '';
+}})()
+"""
+
+# 提取 /latest 页面的帖子链接（最多 30 个）；列表尚未加载时返回 null
+_TOPIC_LINKS_JS = """
+(function() {
+    const links = document.querySelectorAll('a.title.raw-link, a.title[href*="/t/"]');
+    if (!links.length) {
+        return null;
+    }
+    const result = [];
+    for (let i = 0; i < Math.min(links.length, 30); i++) {
+        const a = links[i];
+        if (a.href && a.href.includes('/t/')) {
+            result.push({
+                href: a.href,
+                title: (a.innerText || a.textContent || '').trim().substring(0, 50)
+            });
+        }
+    }
+    return result;
+})()
+"""
+
+# 点赞：在前几个未点赞的按钮中随机点击一个，返回是否点击
+_LIKE_POST_JS = """
+(function() {
+    const likeButtons = document.querySelectorAll(
+        'button.like:not(.has-like), ' +
+        'button[class*="like"]:not(.liked):not(.has-like), ' +
+        '.post-controls button.toggle-like:not(.has-like)'
+    );
+    if (likeButtons.length > 0) {
+        const randomIndex = Math.floor(Math.random() * Math.min(likeButtons.length, 3));
+        const btn = likeButtons[randomIndex];
+        if (btn && !btn.disabled) {
+            btn.click();
+            return true;
+        }
+    }
+    return false;
+})()
+"""
+
+# 分步滚动阅读脚本：随机滚动 200-500px，偶尔回滚 50-150px，每步停留 minDelay-maxDelay 秒，
+# 到底部（或达到 maxSteps 步）后再停留 3-5 秒；页面无需滚动时只停留一次。返回滚动次数。
+_SCROLL_AND_READ_JS = """
+async (minDelay, maxDelay, backChance, maxSteps) => {
+    const sleep = (seconds) => new Promise((resolve) => setTimeout(resolve, seconds * 1000));
+    const uniform = (a, b) => a + Math.random() * (b - a);
+    const randint = (a, b) => Math.floor(uniform(a, b + 1));
+    // 每步重新读取页面高度：Discourse 滚动时会继续加载后面的楼层
+    const bottom = () => Math.max(0, document.body.scrollHeight - window.innerHeight);
+
+    if (bottom() <= 0) {
+        await sleep(uniform(minDelay, maxDelay));
+        return 0;
+    }
+
+    let current = 0;
+    let count = 0;
+    while (current < bottom() && count < maxSteps) {
+        count += 1;
+        if (count > 2 && Math.random() < backChance) {
+            current = Math.max(0, current - randint(50, 150));
+            window.scrollTo({top: current, behavior: 'smooth'});
+            await sleep(uniform(1, 2));
+        }
+        current = Math.min(current + randint(200, 500), bottom());
+        window.scrollTo({top: current, behavior: 'smooth'});
+        await sleep(uniform(minDelay, maxDelay));
+    }
+
+    window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'});
+    await sleep(uniform(3, 5));
+    return count;
+}
+"""
+
+# 多账号共享的 nodriver 浏览器（按需启动，每个账号使用独立的浏览器上下文）
+_shared_browser: BrowserManager | None = None
+_shared_browser_lock = asyncio.Lock()
+
+
+async def get_shared_browser(headless: bool, max_retries: int = 3) -> BrowserManager:
+    """获取共享的 nodriver 浏览器，首次调用时启动
+
+    Args:
+        headless: 是否无头模式
+        max_retries: 启动失败时的最大重试次数
+
+    Returns:
+        共享的 BrowserManager
+    """
+    global _shared_browser
+    async with _shared_browser_lock:
+        if _shared_browser is None:
+            manager = BrowserManager(engine="nodriver", headless=headless)
+            await manager.start(max_retries=max_retries)
+            _shared_browser = manager
+        return _shared_browser
+
+
+async def close_shared_browser() -> None:
+    """关闭共享浏览器（所有账号处理完成后调用）"""
+    global _shared_browser
+    async with _shared_browser_lock:
+        if _shared_browser is not None:
+            with contextlib.suppress(Exception):
+                await _shared_browser.close()
+            _shared_browser = None
 
 
 class LinuxDOAdapter(BasePlatformAdapter):
-    """LinuxDO 论坛自动浏览适配器"""
+    """LinuxDO 论坛自动浏览适配器
+
+    每个账号一个实例，多个实例可以并发运行 login()/checkin()。
+    并发上限由调用方控制（见 linuxdo_browse.py 的 LINUXDO_CONCURRENCY），
+    连接池通过 http_transport 共享、请求节奏通过 rate_limiter 共享，
+    Cookie 与 CSRF Token 始终按实例隔离。
+    """
 
     BASE_URL = "https://linux.do"
     LATEST_URL = "https://linux.do/latest.json"
     TOP_URL = "https://linux.do/top.json"
     TIMINGS_URL = "https://linux.do/topics/timings"
 
-    # Cookie 持久化文件路径
-    COOKIE_CACHE_DIR = ".linuxdo_cookies"
+    # 表单 POST 请求附加的请求头（其余请求头是客户端默认值，只在创建客户端时构建一次）
+    FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"}
+
+    # 登录表单用户名输入框（多个候选选择器合并为一个 CSS 选择器）
+    LOGIN_INPUT_SELECTOR = '#login-account-name, input[name="login"], input[type="text"]'
+
+    # 等待导航事件时的兜底检查间隔（秒），防止错过不触发导航的页面变化
+    NAVIGATION_FALLBACK_INTERVAL = 5.0
+
+    # API 模式下同时浏览的帖子数（仍受共享限速器约束）
+    API_BROWSE_CONCURRENCY = 5
+
+    # 收到 429 时按 Retry-After 等待后重发一次；缺省/超出范围时的等待秒数
+    RATE_LIMIT_DEFAULT_WAIT = 10.0
+    RATE_LIMIT_MAX_WAIT = 60.0
+
+    # Cookie 持久化目录（CI 中通过 actions/cache 在多次运行之间保留）
+    COOKIE_CACHE_DIR = os.environ.get("LINUXDO_COOKIE_CACHE_DIR", ".linuxdo_cookies")
 
     def __init__(
         self,
@@ -49,6 +229,9 @@ class LinuxDOAdapter(BasePlatformAdapter):
         account_name: str | None = None,
         browse_minutes: int = 20,
         cookies: dict | str | None = None,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: TokenBucket | None = None,
+        share_browser: bool = False,
     ):
         """初始化 LinuxDO 适配器
 
@@ -58,6 +241,9 @@ class LinuxDOAdapter(BasePlatformAdapter):
             account_name: 账号显示名称
             browse_minutes: 浏览时长（分钟，默认 20）
             cookies: 预设的 Cookie（优先使用，跳过浏览器登录）
+            http_transport: 共享的 HTTP 传输层（多账号复用连接池，Cookie 仍按账号隔离）
+            rate_limiter: 共享的令牌桶限速器，约束页面访问/API 请求节奏
+            share_browser: 是否复用共享的 nodriver 浏览器（独立上下文隔离 Cookie）
         """
         self.username = username
         self.password = password
@@ -66,13 +252,19 @@ class LinuxDOAdapter(BasePlatformAdapter):
         self._preset_cookies = self._parse_cookies(cookies)
 
         self._browser_manager: BrowserManager | None = None
-        self.client: httpx.Client | None = None
+        self._http_transport = http_transport
+        self._rate_limiter = rate_limiter
+        self._share_browser = share_browser
+        self.client: httpx.AsyncClient | None = None
+        self._jar: CookieJar | None = None
         self._cookies: dict = {}
         self._csrf_token: str | None = None
         self._browsed_count: int = 0
         self._total_time: int = 0
         self._likes_given: int = 0  # 记录点赞数
         self._login_method: str = "unknown"  # 记录登录方式
+        self._rng = random.Random()  # 本账号使用的随机数生成器（延迟、选帖、点赞等）
+        self._cookie_cache_path: Path | None = None
 
     def _parse_cookies(self, cookies: dict | str | None) -> dict:
         """解析 Cookie 为字典格式"""
@@ -86,20 +278,23 @@ class LinuxDOAdapter(BasePlatformAdapter):
         result = {}
         if isinstance(cookies, str):
             for item in cookies.split(";"):
-                item = item.strip()
-                if "=" in item:
-                    key, value = item.split("=", 1)
-                    result[key.strip()] = value.strip()
+                key, sep, value = item.partition("=")
+                if sep:
+                    # 常见键（_forum_session/_t/cf_clearance）驻留，多账号间共享同一字符串对象
+                    result[sys.intern(key.strip())] = value.strip()
         return result
 
     def _get_cookie_cache_path(self) -> Path:
-        """获取 Cookie 缓存文件路径"""
-        cache_dir = Path(self.COOKIE_CACHE_DIR)
-        cache_dir.mkdir(exist_ok=True)
+        """获取 Cookie 缓存文件路径（首次调用时计算，之后直接复用）
 
-        # 使用用户名或账号名作为文件名
-        safe_name = (self.username or self._account_name or "default").replace("/", "_").replace("\\", "_")
-        return cache_dir / f"{safe_name}.json"
+        目录只在保存缓存时创建，读取路径不触碰文件系统。
+        """
+        if self._cookie_cache_path is None:
+            # 使用用户名或账号名的哈希作为文件名，避免缓存目录中出现明文用户名
+            account_key = self.username or self._account_name or "default"
+            account_hash = hashlib.sha256(account_key.encode("utf-8")).hexdigest()[:16]
+            self._cookie_cache_path = Path(self.COOKIE_CACHE_DIR) / f"{account_hash}.json"
+        return self._cookie_cache_path
 
     def _load_cached_cookies(self) -> dict:
         """从缓存加载 Cookie"""
@@ -108,8 +303,7 @@ class LinuxDOAdapter(BasePlatformAdapter):
             return {}
 
         try:
-            with open(cache_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(cache_path.read_bytes())
 
             # 检查是否过期（默认 7 天）
             saved_time = data.get("saved_at", 0)
@@ -139,8 +333,12 @@ class LinuxDOAdapter(BasePlatformAdapter):
                 "saved_at": time.time(),
                 "username": self.username,
             }
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 先写临时文件再原子替换，进程中途被杀时不会留下损坏的缓存
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(_json_dumps(data))
+            os.replace(tmp_path, cache_path)
             logger.info(f"[{self.account_name}] Cookie 已保存到缓存")
         except Exception as e:
             logger.warning(f"[{self.account_name}] 保存 Cookie 缓存失败: {e}")
@@ -153,6 +351,11 @@ class LinuxDOAdapter(BasePlatformAdapter):
     def account_name(self) -> str:
         return self._account_name
 
+    async def _throttle(self) -> None:
+        """按共享限速器的节奏等待（未配置限速器时立即返回）"""
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+
     async def login(self) -> bool:
         """登录 LinuxDO
 
@@ -203,16 +406,15 @@ class LinuxDOAdapter(BasePlatformAdapter):
             是否登录成功
         """
         self._cookies = cookies.copy()
-        self._csrf_token = cookies.get("_forum_session")
+        self._set_csrf_token(cookies.get("_forum_session"))
         self._init_http_client()
 
         # 验证 Cookie 是否有效
         try:
-            headers = self._build_headers()
-            response = self.client.get(f"{self.BASE_URL}/session/current.json", headers=headers)
+            response = await self._request("GET", f"{self.BASE_URL}/session/current.json")
 
             if response.status_code == 200:
-                data = response.json()
+                data = self._parse_json(response)
                 current_user = data.get("current_user")
                 if current_user:
                     username = current_user.get("username", "Unknown")
@@ -278,12 +480,23 @@ class LinuxDOAdapter(BasePlatformAdapter):
                         user_data_dir = str(profile_root / f"acct_{account_key}")
                         logger.info(f"[{self.account_name}] nodriver 复用配置目录: {user_data_dir}")
 
-                self._browser_manager = BrowserManager(
-                    engine=candidate,
-                    headless=headless,
-                    user_data_dir=user_data_dir,
-                )
-                await self._browser_manager.start(max_retries=max_retries)
+                # 持久化配置目录需要独占浏览器进程，此时不共享
+                if candidate == "nodriver" and self._share_browser and not user_data_dir:
+                    try:
+                        shared = await get_shared_browser(headless=headless, max_retries=max_retries)
+                        self._browser_manager = await shared.new_isolated_session()
+                        logger.info(f"[{self.account_name}] 复用共享浏览器（独立上下文）")
+                    except Exception as e:
+                        logger.warning(f"[{self.account_name}] 共享浏览器不可用，改为独立启动: {e}")
+                        self._browser_manager = None
+
+                if self._browser_manager is None:
+                    self._browser_manager = BrowserManager(
+                        engine=candidate,
+                        headless=headless,
+                        user_data_dir=user_data_dir,
+                    )
+                    await self._browser_manager.start(max_retries=max_retries)
 
                 # 获取实际使用的引擎（兼容 BrowserManager 内部 fallback）
                 actual_engine = self._browser_manager.engine
@@ -313,9 +526,68 @@ class LinuxDOAdapter(BasePlatformAdapter):
             logger.error(f"[{self.account_name}] 浏览器登录最终失败: {last_error}")
         return False
 
+    @contextlib.asynccontextmanager
+    async def _navigation_events(self, tab):
+        """订阅标签页的导航事件（CDP Page.frameNavigated / navigatedWithinDocument / loadEventFired）
+
+        页面发生导航或加载完成时设置 asyncio.Event，调用方等待事件而不是固定间隔轮询。
+
+        Yields:
+            导航事件标志（调用方等待前先 clear）
+        """
+        navigated = asyncio.Event()
+
+        def _on_navigation(_event) -> None:
+            navigated.set()
+
+        event_types = (
+            nodriver.cdp.page.FrameNavigated,
+            nodriver.cdp.page.NavigatedWithinDocument,
+            nodriver.cdp.page.LoadEventFired,
+        )
+        for event_type in event_types:
+            tab.add_handler(event_type, _on_navigation)
+        try:
+            yield navigated
+        finally:
+            for event_type in event_types:
+                with contextlib.suppress(Exception):
+                    tab.remove_handler(event_type, _on_navigation)
+
+    async def _wait_navigation(self, navigated: asyncio.Event, timeout: float) -> None:
+        """等待下一次导航事件，最多等待 timeout 秒"""
+        navigated.clear()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(navigated.wait(), timeout=timeout)
+
+    @staticmethod
+    async def _evaluate_value(tab, expression: str, await_promise: bool = False):
+        """执行表达式并按值返回结果
+
+        tab.evaluate 在结果为 false/0/空字符串时返回的是 RemoteObject（真值），
+        这里直接取 RemoteObject.value，保证布尔判断可靠。
+
+        Returns:
+            表达式的值；脚本抛出异常时返回 None
+        """
+        remote_object, exception = await tab.send(
+            nodriver.cdp.runtime.evaluate(
+                expression=expression,
+                user_gesture=True,
+                await_promise=await_promise,
+                return_by_value=True,
+            )
+        )
+        if exception:
+            return None
+        return remote_object.value
+
     async def _wait_for_cloudflare_nodriver(self, tab, timeout: int = 30) -> bool:
         """等待 Cloudflare 挑战完成（nodriver 专用）
 
+        只在页面发生导航（挑战通过后会跳转/刷新）时检查页面标题；
+        为防止错过原地更新的挑战页，最长每 NAVIGATION_FALLBACK_INTERVAL 秒兜底检查一次。
+
         Args:
             tab: nodriver 标签页
             timeout: 超时时间（秒）
@@ -325,38 +597,30 @@ class LinuxDOAdapter(BasePlatformAdapter):
         """
         logger.info(f"[{self.account_name}] 检测 Cloudflare 挑战...")
 
-        start_time = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            try:
-                # 获取页面标题
-                title = await tab.evaluate("document.title")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-                # Cloudflare 挑战页面的特征
-                cf_indicators = [
-                    "just a moment",
-                    "checking your browser",
-                    "please wait",
-                    "verifying",
-                    "something went wrong",
-                ]
-
-                title_lower = title.lower() if title else ""
+        async with self._navigation_events(tab) as navigated:
+            while loop.time() < deadline:
+                try:
+                    # 获取页面标题
+                    title = await self._evaluate_value(tab, "document.title")
 
-                # 检查是否还在 Cloudflare 挑战中
-                is_cf_page = any(ind in title_lower for ind in cf_indicators)
+                    # 检查是否还在 Cloudflare 挑战中
+                    is_cf_page = bool(_CF_TITLE_RE.search(title or ""))
 
-                if not is_cf_page and title and "linux" in title_lower:
-                    logger.success(f"[{self.account_name}] Cloudflare 挑战通过！页面标题: {title}")
-                    return True
+                    if not is_cf_page and title and "linux" in title.lower():
+                        logger.success(f"[{self.account_name}] Cloudflare 挑战通过！页面标题: {title}")
+                        return True
 
-                if is_cf_page:
-                    logger.debug(f"[{self.account_name}] 等待 Cloudflare... 当前标题: {title}")
+                    if is_cf_page:
+                        logger.debug(f"[{self.account_name}] 等待 Cloudflare... 当前标题: {title}")
 
-            except Exception as e:
-                logger.debug(f"[{self.account_name}] 检查页面状态时出错: {e}")
+                except Exception as e:
+                    logger.debug(f"[{self.account_name}] 检查页面状态时出错: {e}")
 
-            await asyncio.sleep(2)
+                remaining = deadline - loop.time()
+                await self._wait_navigation(navigated, max(0.0, min(remaining, self.NAVIGATION_FALLBACK_INTERVAL)))
 
         logger.warning(f"[{self.account_name}] 等待 Cloudflare 超时 ({timeout}s)")
         return False
@@ -411,15 +675,48 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
         return False
 
+    async def _inject_cf_clearance(self, tab) -> None:
+        """在首次导航前把已有的 cf_clearance 写入浏览器
+
+        会话 Cookie（_t/_forum_session）此时已验证无效，不再注入，
+        只复用 Cloudflare 的通行凭证。
+        """
+        cookies = {**self._preset_cookies, **self._cookies}
+        cf_clearance = cookies.get("cf_clearance")
+        if not cf_clearance:
+            return
+
+        try:
+            await tab.send(
+                nodriver.cdp.network.set_cookies(
+                    [
+                        nodriver.cdp.network.CookieParam(
+                            name="cf_clearance",
+                            value=cf_clearance,
+                            domain=".linux.do",
+                            path="/",
+                            secure=True,
+                            http_only=True,
+                        )
+                    ]
+                )
+            )
+            logger.debug(f"[{self.account_name}] 已注入 cf_clearance")
+        except Exception as e:
+            logger.debug(f"[{self.account_name}] 注入 cf_clearance 失败: {e}")
+
     async def _login_nodriver(self) -> bool:
         """使用 nodriver 登录（优化版本，支持 GitHub Actions）"""
         tab = self._browser_manager.page
 
+        # 0. 注入之前拿到的 cf_clearance，仍有效时首页可直接通过 Cloudflare
+        await self._inject_cf_clearance(tab)
+
         # 1. 先访问首页，让 Cloudflare 验证
         logger.info(f"[{self.account_name}] 访问 LinuxDO 首页...")
         await tab.get(self.BASE_URL)
 
-        # 2. 等待 Cloudflare 挑战完成（多次重试策略）
+        # 2. 等待 Cloudflare 挑战完成（多次重试策略；已通过时首次检查即返回）
         cf_passed = await self._wait_for_cloudflare_with_retry(tab, max_retries=3)
         if not cf_passed:
             logger.error(f"[{self.account_name}] Cloudflare 验证失败")
@@ -428,34 +725,19 @@ class LinuxDOAdapter(BasePlatformAdapter):
         # 3. 访问登录页面
         logger.info(f"[{self.account_name}] 访问登录页面...")
         await tab.get(f"{self.BASE_URL}/login")
-        await asyncio.sleep(3)
 
-        # 4. 等待登录表单加载
+        # 4. 等待登录表单加载（输入框出现即继续，不再固定等待）
         logger.info(f"[{self.account_name}] 等待登录表单加载...")
-        await asyncio.sleep(5)
-
-        # 使用 JS 等待输入框出现
-        for _ in range(10):
-            try:
-                has_input = await tab.evaluate("""
-                    (function() {
-                        const input = document.querySelector('#login-account-name') ||
-                                      document.querySelector('input[name="login"]') ||
-                                      document.querySelector('input[type="text"]');
-                        return !!input;
-                    })()
-                """)
-                if has_input:
-                    logger.info(f"[{self.account_name}] 登录表单已加载")
-                    break
-            except Exception:
-                pass
-            await asyncio.sleep(1)
+        try:
+            await tab.select(self.LOGIN_INPUT_SELECTOR, timeout=15)
+            logger.info(f"[{self.account_name}] 登录表单已加载")
+        except asyncio.TimeoutError:
+            logger.warning(f"[{self.account_name}] 等待登录表单超时，继续尝试填写")
 
         # 5. 填写用户名（使用 JS 直接赋值，避免 send_keys 丢失字符）
         try:
             # 使用 JS 直接设置输入框的值，比 send_keys 更可靠
-            username_filled = await tab.evaluate(f"""
+            username_filled = await self._evaluate_value(tab, f"""
                 (function() {{
                     const input = document.querySelector('#login-account-name') ||
                                   document.querySelector('input[name="login"]') ||
@@ -486,7 +768,7 @@ class LinuxDOAdapter(BasePlatformAdapter):
             # 转义密码中的特殊字符（单引号、反斜杠）
             escaped_password = self.password.replace("\\", "\\\\").replace("'", "\\'")
 
-            password_filled = await tab.evaluate(f"""
+            password_filled = await self._evaluate_value(tab, f"""
                 (function() {{
                     const input = document.querySelector('#login-account-password') ||
                                   document.querySelector('input[type="password"]');
@@ -514,16 +796,11 @@ class LinuxDOAdapter(BasePlatformAdapter):
         # 7. 点击登录按钮（使用 JS 点击，比 nodriver 原生 click 更可靠）
         logger.info(f"[{self.account_name}] 点击登录按钮...")
         try:
-            # 先等待一下确保表单完全加载
-            await asyncio.sleep(1)
-
             # 使用 JS 点击登录按钮（经测试比 nodriver 原生 click 更可靠）
-            clicked = await tab.evaluate("""
+            clicked = await self._evaluate_value(tab, """
                 (function() {
                     const btn = document.querySelector('#login-button') ||
-                                document.querySelector('#signin-button') ||
-                                document.querySelector('button[type="submit"]') ||
-                                document.querySelector('input[type="submit"]');
+                                document.querySelector('#signin-button, button[type="submit"], input[type="submit"]');
                     if (btn) {
                         btn.click();
                         return true;
@@ -556,47 +833,31 @@ class LinuxDOAdapter(BasePlatformAdapter):
             logger.error(f"[{self.account_name}] 点击登录按钮失败: {e}")
             return False
 
-        # 8. 等待登录完成
+        # 8. 等待登录完成：页面导航时立即检查 URL，没有导航时兜底检查错误提示（最多 60 秒）
         logger.info(f"[{self.account_name}] 等待登录完成...")
-        for i in range(60):  # 增加到 60 秒
-            await asyncio.sleep(1)
-
-            # 检查 URL 是否变化
-            current_url = tab.target.url if hasattr(tab, 'target') else ""
-            if "login" not in current_url.lower() and current_url:
-                logger.info(f"[{self.account_name}] 页面已跳转: {current_url}")
-                break
-
-            # 检查是否有错误提示（每 5 秒检查一次）
-            if i % 5 == 0:
-                error_msg = await tab.evaluate("""
-                    (function() {
-                        // 检查各种错误提示元素
-                        const selectors = [
-                            '.alert-error',
-                            '.error',
-                            '#error-message',
-                            '.flash-error',
-                            '.login-error',
-                            '#login-error',
-                            '.ember-view.alert.alert-error',
-                            '[class*="error"]'
-                        ];
-                        for (const sel of selectors) {
-                            const el = document.querySelector(sel);
-                            if (el && el.innerText && el.innerText.trim()) {
-                                return el.innerText.trim();
-                            }
-                        }
-                        return '';
-                    })()
-                """)
+        login_timeout = 60
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + login_timeout
+        async with self._navigation_events(tab) as navigated:
+            while True:
+                # 检查 URL 是否变化
+                current_url = tab.target.url if hasattr(tab, 'target') else ""
+                if "login" not in current_url.lower() and current_url:
+                    logger.info(f"[{self.account_name}] 页面已跳转: {current_url}")
+                    break
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                # 检查是否有错误提示
+                error_msg = await self._evaluate_value(tab, _LOGIN_ERROR_JS)
                 if error_msg:
                     logger.error(f"[{self.account_name}] 登录错误: {error_msg}")
                     return False
 
-            if i % 10 == 0:
-                logger.debug(f"[{self.account_name}] 等待登录... ({i}s)")
+                logger.debug(f"[{self.account_name}] 等待登录... ({int(login_timeout - remaining)}s)")
+                await self._wait_navigation(navigated, min(remaining, self.NAVIGATION_FALLBACK_INTERVAL))
 
         await asyncio.sleep(2)
 
@@ -627,7 +888,7 @@ class LinuxDOAdapter(BasePlatformAdapter):
             logger.warning(f"[{self.account_name}] 获取 cookies 失败: {e}")
 
         # 获取 CSRF token
-        self._csrf_token = self._cookies.get('_forum_session')
+        self._set_csrf_token(self._cookies.get("_forum_session"))
 
         # 初始化 HTTP 客户端
         self._init_http_client()
@@ -635,17 +896,35 @@ class LinuxDOAdapter(BasePlatformAdapter):
         return True
 
     async def _login_drissionpage(self) -> bool:
-        """使用 DrissionPage 登录"""
-        import time
+        """使用 DrissionPage 登录
+
+        DrissionPage 的接口都是同步阻塞调用，放到线程中执行，避免阻塞其它账号的协程。
+        """
         page = self._browser_manager.page
 
         logger.info(f"[{self.account_name}] 访问 LinuxDO 登录页面...")
-        page.get(f"{self.BASE_URL}/login")
-        time.sleep(2)
+        await asyncio.to_thread(page.get, f"{self.BASE_URL}/login")
+        await asyncio.sleep(2)
 
         await self._browser_manager.wait_for_cloudflare(timeout=30)
 
         # 填写登录表单
+        if await asyncio.to_thread(self._submit_login_form_drissionpage, page):
+            await asyncio.sleep(5)
+
+        # 获取 cookies
+        for cookie in await asyncio.to_thread(page.cookies):
+            self._cookies[cookie['name']] = cookie['value']
+
+        self._init_http_client()
+        return True
+
+    def _submit_login_form_drissionpage(self, page) -> bool:
+        """填写并提交登录表单（同步调用，在线程中执行）
+
+        Returns:
+            是否点击了登录按钮
+        """
         username_input = page.ele('#login-account-name', timeout=10)
         if username_input:
             username_input.input(self.username)
@@ -659,14 +938,8 @@ class LinuxDOAdapter(BasePlatformAdapter):
         login_btn = page.ele('#login-button', timeout=5)
         if login_btn:
             login_btn.click()
-            time.sleep(5)
-
-        # 获取 cookies
-        for cookie in page.cookies():
-            self._cookies[cookie['name']] = cookie['value']
-
-        self._init_http_client()
-        return True
+            return True
+        return False
 
     async def _login_playwright(self) -> bool:
         """使用 Playwright 登录"""
@@ -692,13 +965,51 @@ class LinuxDOAdapter(BasePlatformAdapter):
         return True
 
     def _init_http_client(self):
-        """初始化 HTTP 客户端"""
-        self.client = httpx.Client(timeout=30.0)
+        """初始化 HTTP 客户端
+
+        每个账号使用独立的 AsyncClient（独立 Cookie），若注入了共享传输层则复用其连接池。
+        启用 HTTP/2 后同一账号的请求复用一条连接（多路复用），只需一次 TLS 握手。
+        客户端已存在时（预设 Cookie 失败后再试缓存 Cookie、浏览器登录等）只替换 Cookie 和请求头，
+        继续复用已建立的连接。
+        """
+        if self.client is not None and not self.client.is_closed:
+            self._fill_cookie_jar(self._jar)
+            self.client.headers = self._build_headers()
+            return
+
+        self._jar = self._build_cookie_jar()
+        self.client = httpx.AsyncClient(
+            headers=self._build_headers(),
+            cookies=self._jar,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=self._http_transport,
+        )
+
+    def _build_cookie_jar(self) -> CookieJar:
+        """一次性构建 Cookie Jar
+
+        直接把 CookieJar 交给 AsyncClient（httpx 不会再复制一份），
+        客户端与 self._jar 共享同一份 Cookie 存储，之后只需更新单个条目。
+        """
+        jar = CookieJar()
+        self._fill_cookie_jar(jar)
+        return jar
+
+    def _fill_cookie_jar(self, jar: CookieJar) -> None:
+        """清空 Cookie Jar 并写入当前 Cookie"""
+        jar.clear()
+        cookies = httpx.Cookies(jar)
         for name, value in self._cookies.items():
-            self.client.cookies.set(name, value, domain="linux.do")
+            cookies.set(name, value, domain="linux.do")
 
     def _build_headers(self) -> dict:
-        """构建请求头"""
+        """构建请求头
+
+        只在创建 HTTP 客户端时调用一次，作为客户端的默认请求头；
+        之后 CSRF Token 变化时通过 _set_csrf_token 直接更新客户端请求头。
+        """
         headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -714,6 +1025,12 @@ class LinuxDOAdapter(BasePlatformAdapter):
             headers["X-CSRF-Token"] = self._csrf_token
         return headers
 
+    def _set_csrf_token(self, token: str | None) -> None:
+        """更新 CSRF Token（同步到已创建的 HTTP 客户端请求头）"""
+        self._csrf_token = token
+        if self.client and token:
+            self.client.headers["X-CSRF-Token"] = token
+
     async def checkin(self) -> CheckinResult:
         """执行浏览帖子操作"""
         logger.info(f"[{self.account_name}] 开始浏览帖子...")
@@ -739,7 +1056,8 @@ class LinuxDOAdapter(BasePlatformAdapter):
                 logger.warning(f"[{self.account_name}] 浏览器浏览失败，回退到 API 模式: {e}")
 
         # 回退到 HTTP API 模式
-        topics = self._get_topics()
+        await self._throttle()
+        topics = await self._get_topics()
         if not topics:
             return CheckinResult(
                 platform=self.platform_name,
@@ -750,23 +1068,20 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
         # 随机选择帖子浏览（API 模式固定浏览 10 个）
         browse_count = min(10, len(topics))
-        selected_topics = random.sample(topics, browse_count)
+        selected_topics = self._rng.sample(topics, browse_count)
 
         logger.info(f"[{self.account_name}] 将浏览 {browse_count} 个帖子（API 模式）")
 
-        for i, topic in enumerate(selected_topics):
-            topic_id = topic.get("id")
-            title = topic.get("title", "Unknown")[:30]
-
-            logger.info(f"[{self.account_name}] [{i+1}/{browse_count}] 浏览: {title}...")
-
-            success = self._browse_topic(topic_id)
-            if success:
-                self._browsed_count += 1
-
-            # 随机延迟，模拟真实阅读
-            delay = random.uniform(3, 8)
-            await asyncio.sleep(delay)
+        # 多个帖子并发浏览，重叠网络等待和阅读延迟
+        semaphore = asyncio.Semaphore(self.API_BROWSE_CONCURRENCY)
+        results = await asyncio.gather(
+            *[
+                self._visit_topic_api(semaphore, i, browse_count, topic)
+                for i, topic in enumerate(selected_topics)
+            ],
+            return_exceptions=True,
+        )
+        self._browsed_count += sum(1 for r in results if r is True)
 
         details = {
             "browsed": self._browsed_count,
@@ -791,6 +1106,28 @@ class LinuxDOAdapter(BasePlatformAdapter):
                 details=details,
             )
 
+    async def _visit_topic_api(self, semaphore: asyncio.Semaphore, i: int, total: int, topic: dict) -> bool:
+        """API 模式下浏览单个帖子
+
+        Args:
+            semaphore: 限制同时浏览的帖子数
+            i: 帖子序号（仅用于日志）
+            total: 帖子总数（仅用于日志）
+            topic: 帖子信息（来自 /latest.json）
+
+        Returns:
+            是否浏览成功
+        """
+        async with semaphore:
+            # 请求前随机错开，避免并发请求同时到达
+            await asyncio.sleep(self._rng.uniform(0, 2))
+
+            title = topic.get("title", "Unknown")[:30]
+            logger.info(f"[{self.account_name}] [{i+1}/{total}] 浏览: {title}...")
+
+            await self._throttle()
+            return await self._browse_topic(topic.get("id"), topic.get("highest_post_number"))
+
     async def _browse_topics_via_browser(self) -> int:
         """使用浏览器直接浏览帖子（更真实的浏览行为）
 
@@ -820,6 +1157,7 @@ class LinuxDOAdapter(BasePlatformAdapter):
             "scroll_delay": (3, 6),   # 每次滚动间隔 3-6 秒
             "like_chance": 0.3,       # 30% 概率点赞
             "scroll_back_chance": 0.2,  # 20% 概率回滚（模拟回看）
+            "max_scrolls": 60,        # 单个帖子最多滚动次数（长帖子会不断加载新楼层）
         }
 
         logger.info(
@@ -847,44 +1185,18 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
             # 访问最新帖子页面获取新帖子
             logger.info(f"[{self.account_name}] 访问最新帖子页面...")
+            await self._throttle()
             await tab.get(f"{self.BASE_URL}/latest")
-            await asyncio.sleep(5)
 
-            # 等待帖子列表加载
-            for _ in range(10):
-                has_topics = await tab.evaluate("document.querySelectorAll('a.title').length > 0")
-                if has_topics:
+            # 等待帖子列表加载并提取链接（同一个脚本：未加载时返回 null，列表出现即继续，不再固定等待）
+            topic_links = []
+            for _ in range(15):
+                links = await self._evaluate_value(tab, _TOPIC_LINKS_JS)
+                if isinstance(links, list) and links:
+                    topic_links = links
                     break
                 await asyncio.sleep(1)
 
-            # 获取帖子链接
-            topic_links_json = await tab.evaluate("""
-                (function() {
-                    const links = document.querySelectorAll('a.title.raw-link, a.title[href*="/t/"]');
-                    const result = [];
-                    for (let i = 0; i < Math.min(links.length, 30); i++) {
-                        const a = links[i];
-                        if (a.href && a.href.includes('/t/')) {
-                            result.push({
-                                href: a.href,
-                                title: (a.innerText || a.textContent || '').trim().substring(0, 50)
-                            });
-                        }
-                    }
-                    return JSON.stringify(result);
-                })()
-            """)
-
-            # 解析 JSON 结果
-            topic_links = []
-            if topic_links_json and isinstance(topic_links_json, str):
-                try:
-                    topic_links = json.loads(topic_links_json)
-                except json.JSONDecodeError:
-                    logger.warning(f"[{self.account_name}] JSON 解析失败")
-            elif isinstance(topic_links_json, list):
-                topic_links = topic_links_json
-
             if not topic_links:
                 logger.warning(f"[{self.account_name}] 未获取到帖子列表，等待后重试...")
                 await asyncio.sleep(10)
@@ -899,7 +1211,7 @@ class LinuxDOAdapter(BasePlatformAdapter):
                 continue
 
             # 随机打乱顺序
-            random.shuffle(new_topics)
+            self._rng.shuffle(new_topics)
 
             # 浏览帖子直到时间用完或帖子看完
             for topic in new_topics:
@@ -914,14 +1226,15 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
                 try:
                     # 访问帖子
+                    await self._throttle()
                     await tab.get(href)
-                    await asyncio.sleep(random.uniform(3, 5))  # 等待页面加载
+                    await asyncio.sleep(self._rng.uniform(3, 5))  # 等待页面加载
 
                     # 分步滚动到底部（模拟真实阅读，尽量看完整个帖子）
                     await self._scroll_and_read(tab, config)
 
                     # 随机点赞
-                    if random.random() < config['like_chance']:
+                    if self._rng.random() < config['like_chance']:
                         liked = await self._try_like_post(tab)
                         if liked:
                             self._likes_given += 1
@@ -947,68 +1260,27 @@ class LinuxDOAdapter(BasePlatformAdapter):
     async def _scroll_and_read(self, tab, config: dict) -> None:
         """分步滚动页面，模拟真实阅读行为
 
-        核心策略：
-        - 每次滚动间隔 5-8 秒，模拟真实阅读速度
+        核心策略（见 _SCROLL_AND_READ_JS，在页面内一次执行完）：
+        - 每次滚动间隔 scroll_delay 秒，模拟真实阅读速度
         - 滚动距离随机（200-500px），避免机械化
         - 偶尔回滚一小段，模拟回看行为
         - 尽量把帖子看完（滚动到底部）
 
         Args:
             tab: 浏览器标签页
-            config: 浏览配置（包含 scroll_delay, scroll_back_chance）
+            config: 浏览配置（包含 scroll_delay, scroll_back_chance, max_scrolls）
         """
         scroll_delay_min, scroll_delay_max = config['scroll_delay']
         scroll_back_chance = config.get('scroll_back_chance', 0.2)
+        max_scrolls = config.get('max_scrolls', 60)
 
-        # 获取页面高度
-        page_height = await tab.evaluate("document.body.scrollHeight")
-        viewport_height = await tab.evaluate("window.innerHeight")
-
-        # 计算需要滚动的总距离
-        total_scroll = max(0, page_height - viewport_height)
-
-        if total_scroll <= 0:
-            # 页面不需要滚动，直接等待一段时间
-            delay = random.uniform(scroll_delay_min, scroll_delay_max)
-            logger.debug(f"[{self.account_name}]   页面无需滚动，阅读 {delay:.1f}s...")
-            await asyncio.sleep(delay)
-            return
-
-        current_scroll = 0
-        scroll_count = 0
-
-        # 持续滚动直到到达底部
-        while current_scroll < total_scroll:
-            scroll_count += 1
-
-            # 随机滚动距离（200-500px），模拟真实滚动
-            scroll_distance = random.randint(200, 500)
-
-            # 偶尔回滚一小段（模拟回看行为）
-            if scroll_count > 2 and random.random() < scroll_back_chance:
-                back_distance = random.randint(50, 150)
-                current_scroll = max(0, current_scroll - back_distance)
-                await tab.evaluate(f"window.scrollTo({{top: {current_scroll}, behavior: 'smooth'}})")
-                logger.debug(f"[{self.account_name}]   ↑ 回滚 {back_distance}px（模拟回看）")
-                await asyncio.sleep(random.uniform(1, 2))
-
-            # 滚动一步
-            current_scroll = min(current_scroll + scroll_distance, total_scroll)
-            await tab.evaluate(f"window.scrollTo({{top: {current_scroll}, behavior: 'smooth'}})")
-
-            # 等待 5-8 秒，模拟真实阅读
-            delay = random.uniform(scroll_delay_min, scroll_delay_max)
-            progress = int(current_scroll / total_scroll * 100)
-            logger.debug(f"[{self.account_name}]   滚动 {scroll_count} ({progress}%)，阅读 {delay:.1f}s...")
-            await asyncio.sleep(delay)
-
-        # 确保滚动到底部
-        await tab.evaluate("window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'})")
-
-        # 在底部停留一会儿（3-5 秒）
-        final_read = random.uniform(3, 5)
-        logger.debug(f"[{self.account_name}]   底部阅读 {final_read:.1f}s...")
-        await asyncio.sleep(final_read)
+        # 整个滚动阅读过程在页面内一次执行完（浏览器端等待），避免每一步一次 CDP 往返
+        scroll_count = await self._evaluate_value(
+            tab,
+            f"({_SCROLL_AND_READ_JS})({scroll_delay_min}, {scroll_delay_max}, {scroll_back_chance}, {max_scrolls})",
+            await_promise=True,
+        )
+        logger.debug(f"[{self.account_name}]   阅读完成，共滚动 {scroll_count} 次")
 
     async def _try_like_post(self, tab) -> bool:
         """尝试给帖子点赞
@@ -1022,31 +1294,11 @@ class LinuxDOAdapter(BasePlatformAdapter):
         try:
             # 查找可点赞的按钮（未点赞状态）
             # Discourse 的点赞按钮通常有 like 相关的 class
-            liked = await tab.evaluate("""
-                (function() {
-                    // 查找第一个帖子的点赞按钮（排除已点赞的）
-                    const likeButtons = document.querySelectorAll(
-                        'button.like:not(.has-like), ' +
-                        'button[class*="like"]:not(.liked):not(.has-like), ' +
-                        '.post-controls button.toggle-like:not(.has-like)'
-                    );
-
-                    // 随机选择一个点赞按钮（如果有多个）
-                    if (likeButtons.length > 0) {
-                        const randomIndex = Math.floor(Math.random() * Math.min(likeButtons.length, 3));
-                        const btn = likeButtons[randomIndex];
-                        if (btn && !btn.disabled) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                    return false;
-                })()
-            """)
+            liked = await self._evaluate_value(tab, _LIKE_POST_JS)
 
             if liked:
                 logger.debug(f"[{self.account_name}]   👍 点赞成功")
-                await asyncio.sleep(random.uniform(0.5, 1.5))  # 点赞后短暂等待
+                await asyncio.sleep(self._rng.uniform(0.5, 1.5))  # 点赞后短暂等待
                 return True
 
         except Exception as e:
@@ -1054,15 +1306,53 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
         return False
 
-    def _get_topics(self) -> list:
-        """获取帖子列表"""
-        headers = self._build_headers()
+    @retry_decorator(
+        max_retries=3,
+        delay_range=(1.0, 10.0),
+        exponential_backoff=True,
+        exceptions=(httpx.TransportError,),
+        raise_on_failure=True,
+    )
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """发送 HTTP 请求
+
+        仅对网络层错误（DNS、TLS、连接中断、超时）按指数退避重试；
+        429 限流时按 Retry-After 等待（同时暂停共享限速器）后重发一次，其余 HTTP 状态码由调用方自行判断。
+        """
+        response = await self.client.request(method, url, **kwargs)
+        if response.status_code == 429:
+            wait = self._retry_after(response)
+            logger.warning(f"[{self.account_name}] 请求被限流 (429)，{wait:.0f}s 后重试: {url}")
+            if self._rate_limiter:
+                # 暂停共享限速器：其它账号/帖子的请求也一起放缓，而不是各自撞上 429
+                self._rate_limiter.pause(wait)
+                await self._rate_limiter.acquire()
+            else:
+                await asyncio.sleep(wait)
+            response = await self.client.request(method, url, **kwargs)
+        return response
 
+    def _retry_after(self, response: httpx.Response) -> float:
+        """从 429 响应的 Retry-After 头解析等待秒数（限制在 RATE_LIMIT_MAX_WAIT 以内）"""
+        try:
+            wait = float(response.headers.get("Retry-After", self.RATE_LIMIT_DEFAULT_WAIT))
+        except ValueError:
+            # HTTP 日期格式等无法解析的值，使用默认等待时间
+            wait = self.RATE_LIMIT_DEFAULT_WAIT
+        return min(max(wait, 1.0), self.RATE_LIMIT_MAX_WAIT)
+
+    @staticmethod
+    def _parse_json(response: httpx.Response):
+        """解析 JSON 响应（直接解析原始字节，跳过文本解码）"""
+        return _json_loads(response.content)
+
+    async def _get_topics(self) -> list:
+        """获取帖子列表"""
         try:
             # 获取最新帖子
-            response = self.client.get(self.LATEST_URL, headers=headers)
+            response = await self._request("GET", self.LATEST_URL)
             if response.status_code == 200:
-                data = response.json()
+                data = self._parse_json(response)
                 topics = data.get("topic_list", {}).get("topics", [])
                 logger.info(f"[{self.account_name}] 获取到 {len(topics)} 个帖子")
                 return topics
@@ -1071,55 +1361,59 @@ class LinuxDOAdapter(BasePlatformAdapter):
 
         return []
 
-    def _browse_topic(self, topic_id: int) -> bool:
+    async def _browse_topic(self, topic_id: int, highest_post_number: int | None = None) -> bool:
         """浏览单个帖子（发送 timings 请求）
 
         根据 Discourse API，/topics/timings 接口参数格式：
         - topic_id: 帖子 ID
         - topic_time: 总阅读时间（毫秒）
         - timings[n]: 第 n 楼的阅读时间（毫秒）
-        """
-        headers = self._build_headers()
-        headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
 
-        # 先获取帖子详情
+        Args:
+            topic_id: 帖子 ID
+            highest_post_number: 帖子列表中给出的最大楼层号；提供时直接按楼层号构造 timings，
+                省去获取帖子详情的请求
+        """
         try:
-            topic_url = f"{self.BASE_URL}/t/{topic_id}.json"
-            response = self.client.get(topic_url, headers=headers)
-            if response.status_code != 200:
-                return False
+            if highest_post_number:
+                post_numbers = list(range(1, min(highest_post_number, 5) + 1))
+            else:
+                # 列表中没有楼层信息时，先获取帖子详情
+                topic_url = f"{self.BASE_URL}/t/{topic_id}.json"
+                response = await self._request("GET", topic_url)
+                if response.status_code != 200:
+                    return False
 
-            topic_data = response.json()
-            posts = topic_data.get("post_stream", {}).get("posts", [])
+                topic_data = self._parse_json(response)
+                posts = topic_data.get("post_stream", {}).get("posts", [])
+                post_numbers = [post.get("post_number", 1) for post in posts[:5]]
 
-            if not posts:
+            if not post_numbers:
                 return False
 
             # 构建 timings 数据
             # 模拟阅读时间：总时间 5-30 秒
-            total_time = random.randint(5000, 30000)
+            total_time = self._rng.randint(5000, 30000)
             self._total_time += total_time
 
+            # 为每个帖子分配阅读时间（最多前 5 个帖子），每个帖子的时间略有随机波动
             # timings 格式: timings[post_number]=milliseconds
+            time_per_post = total_time // len(post_numbers)
+            randint = self._rng.randint
             timings_data = {
                 "topic_id": topic_id,
                 "topic_time": total_time,
+                **{
+                    f"timings[{post_number}]": max(1000, time_per_post + randint(-500, 500))
+                    for post_number in post_numbers
+                },
             }
 
-            # 为每个帖子分配阅读时间（最多前 5 个帖子）
-            post_count = min(len(posts), 5)
-            time_per_post = total_time // post_count
-
-            for post in posts[:post_count]:
-                post_number = post.get("post_number", 1)
-                # 每个帖子的时间略有随机波动
-                post_time = time_per_post + random.randint(-500, 500)
-                timings_data[f"timings[{post_number}]"] = max(1000, post_time)
-
             # 发送 timings 请求
-            response = self.client.post(
+            response = await self._request(
+                "POST",
                 self.TIMINGS_URL,
-                headers=headers,
+                headers=self.FORM_HEADERS,
                 data=timings_data,
             )
 
@@ -1147,6 +1441,13 @@ class LinuxDOAdapter(BasePlatformAdapter):
                 await self._browser_manager.close()
             self._browser_manager = None
 
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """关闭 HTTP 客户端"""
         if self.client:
-            self.client.close()
+            # 共享传输层由调用方负责关闭，这里只释放自己创建的连接
+            if self._http_transport is None:
+                with contextlib.suppress(Exception):
+                    await self.client.aclose()
             self.client = None
@@ -11,23 +11,34 @@
 """
 
 import asyncio
+import contextlib
 import json
 import os
 import ssl
 import tempfile
-import time
+from collections import Counter
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from urllib.parse import urlparse
 
 import httpx
 from loguru import logger
 
 from platforms.base import CheckinResult, CheckinStatus
-from platforms.linuxdo import LinuxDOAdapter
 from utils.config import DEFAULT_PROVIDERS, AnyRouterAccount, AppConfig, ProviderConfig
 from utils.cookie_cache import CookieCache
 from utils.notify import NotificationManager
 
+# 签到结果中的平台名称（NewAPI 站点结果为 "NewAPI (provider)"）
+PLATFORM_LINUXDO = "LinuxDO"
+PLATFORM_NEWAPI = "NewAPI"
+NEWAPI_PLATFORM_PREFIX = f"{PLATFORM_NEWAPI} ("
+
+
+def _newapi_platform_label(provider_name: str) -> str:
+    """NewAPI 站点结果的平台名称，如 'wong' -> 'NewAPI (wong)'"""
+    return f"{NEWAPI_PLATFORM_PREFIX}{provider_name})"
+
 
 def _create_ssl_context() -> ssl.SSLContext:
     """创建兼容旧服务器的 SSL 上下文"""
@@ -42,13 +53,22 @@ def _create_ssl_context() -> ssl.SSLContext:
 class PlatformManager:
     """平台管理器"""
 
+    # run_platform 支持的平台名称 -> 执行方法名
+    _PLATFORM_METHODS = {
+        "linuxdo": "_run_all_linuxdo",
+        "newapi": "_run_all_newapi",
+    }
+
     def __init__(self, config: AppConfig):
         self.config = config
         self.notify = NotificationManager()
-        self.results: list[CheckinResult] = []
+        self._results: list[CheckinResult] = []
+        self._status_counts: Counter | None = None
+        # NewAPI 站点共享的 HTTP 客户端（可用性探测与签到复用同一连接池，见 _get_http_client）
+        self._http_client: httpx.AsyncClient | None = None
         # Cookie 缓存：OAuth 成功后自动保存，下次优先使用 Cookie+API（更快）
         self._cookie_cache = CookieCache()
-        # NEWAPI_ACCOUNTS 覆盖文件：Secrets 只读时，用文件缓存“最新可用 cookie”覆盖旧配置
+        # NEWAPI_ACCOUNTS 覆盖文件（只读）：启动时用其中的 cookie 覆盖旧配置，并参与导出
         self._newapi_override_file = os.getenv(
             "NEWAPI_ACCOUNTS_OVERRIDE_FILE", ".newapi_accounts_override.json"
         )
@@ -58,8 +78,8 @@ class PlatformManager:
         self._newapi_accounts_export_file = os.getenv(
             "NEWAPI_ACCOUNTS_EXPORT_FILE", os.path.join("签到账户", "NEWAPI_ACCOUNTS.json")
         )
-        self._newapi_original_state: dict[int, dict] = {}
-        self._newapi_override_applied_accounts: set[int] = set()
+        # 并发上限：LinuxDO 浏览每个账号启动一个浏览器，与 linuxdo_browse.py 共用 LINUXDO_CONCURRENCY
+        self._linuxdo_semaphore = asyncio.Semaphore(self._env_int("LINUXDO_CONCURRENCY", 3, min_value=1))
         # 缓存 LinuxDO 账户，用于浏览器回退登录
         self._linuxdo_accounts: list[dict] = []
         self._load_linuxdo_accounts()
@@ -77,20 +97,6 @@ class PlatformManager:
             logger.warning(f"读取 NEWAPI 覆盖文件失败: {e}")
             return {}
 
-    def _save_newapi_accounts_override(self, payload: dict) -> None:
-        """原子写入 NEWAPI 覆盖文件。"""
-        try:
-            target_dir = os.path.dirname(self._newapi_override_file) or "."
-            os.makedirs(target_dir, exist_ok=True)
-            with tempfile.NamedTemporaryFile(
-                mode="w", delete=False, dir=target_dir, encoding="utf-8"
-            ) as tmp:
-                json.dump(payload, tmp, ensure_ascii=False, indent=2)
-                tmp_path = tmp.name
-            os.replace(tmp_path, self._newapi_override_file)
-        except Exception as e:
-            logger.warning(f"写入 NEWAPI 覆盖文件失败: {e}")
-
     @staticmethod
     def _build_newapi_override_keys(provider: str, name: str | None, api_user: str | None) -> list[str]:
         """生成账号覆盖匹配 key（按稳定性优先级）。"""
@@ -124,15 +130,9 @@ class PlatformManager:
             if not hit:
                 continue
 
-            # 记录原始值，便于覆盖cookie失效后回退
-            self._newapi_original_state[id(account)] = {
-                "cookies": account.cookies,
-                "api_user": account.api_user,
-            }
             # 只在内存中覆盖；后续运行将优先使用这个新值
             account.cookies = hit["cookies"]
             account.api_user = hit["api_user"]
-            self._newapi_override_applied_accounts.add(id(account))
             applied += 1
 
             source = hit.get("source", "override")
@@ -144,91 +144,6 @@ class PlatformManager:
         if applied:
             logger.success(f"已应用 {applied} 个 NEWAPI 账号覆盖Cookie")
 
-    def _remove_newapi_account_override(self, account: AnyRouterAccount, provider_name: str) -> None:
-        """删除某账号的覆盖记录（覆盖cookie失效时调用）。"""
-        payload = self._load_newapi_accounts_override()
-        if not payload:
-            return
-
-        original = self._newapi_original_state.get(id(account), {})
-        original_api_user = original.get("api_user")
-        current_api_user = account.api_user
-        current_name = account.name
-
-        delete_keys: list[str] = []
-        for key, value in payload.items():
-            if not isinstance(value, dict):
-                continue
-            if str(value.get("provider", "")) != provider_name:
-                continue
-            val_name = value.get("name")
-            val_api_user = value.get("api_user")
-            if current_name and val_name == current_name:
-                delete_keys.append(key)
-                continue
-            if val_api_user and val_api_user in {current_api_user, original_api_user}:
-                delete_keys.append(key)
-
-        if not delete_keys:
-            return
-        for key in delete_keys:
-            payload.pop(key, None)
-        self._save_newapi_accounts_override(payload)
-        logger.warning(f"已删除失效覆盖Cookie记录: {provider_name}/{current_name or current_api_user}")
-
-    def _restore_newapi_account_original(self, account: AnyRouterAccount) -> bool:
-        """恢复账号到 NEWAPI_ACCOUNTS 原始 cookie/api_user。"""
-        original = self._newapi_original_state.get(id(account))
-        if not original:
-            return False
-        account.cookies = original.get("cookies")
-        account.api_user = original.get("api_user")
-        self._newapi_override_applied_accounts.discard(id(account))
-        return True
-
-    def _persist_newapi_account_override(
-        self,
-        account: AnyRouterAccount,
-        account_name: str,
-        provider_name: str,
-        session_cookie: str,
-        api_user: str,
-        cookies: dict | None = None,
-        source: str = "oauth_refresh",
-    ) -> None:
-        """将新 cookie 持久化为 NEWAPI 账号覆盖，供下次运行优先使用。"""
-        if not session_cookie or not api_user:
-            return
-
-        cookie_bundle: dict[str, str] = {}
-        if isinstance(cookies, dict):
-            cookie_bundle = {
-                str(k): str(v)
-                for k, v in cookies.items()
-                if k and v is not None and str(v).strip()
-            }
-        if "session" not in cookie_bundle:
-            cookie_bundle["session"] = session_cookie
-
-        payload = self._load_newapi_accounts_override()
-        keys = self._build_newapi_override_keys(provider_name, account.name, account.api_user)
-        record = {
-            "provider": provider_name,
-            "name": account.name,
-            "api_user": api_user,
-            "cookies": cookie_bundle,
-            "source": source,
-            "updated_at": str(int(time.time())),
-        }
-        for key in keys:
-            payload[key] = record
-        self._save_newapi_accounts_override(payload)
-
-        # 同步更新当前内存对象，确保本次运行后续逻辑直接用新值
-        account.cookies = cookie_bundle
-        account.api_user = api_user
-        logger.success(f"[{account_name}] 已覆盖 NEWAPI 账号Cookie，下次运行将优先使用新Cookie")
-
     def _load_linuxdo_accounts(self) -> None:
         """加载 LinuxDO 账户用于浏览器回退登录（不用于浏览帖子）"""
         # 从配置中获取 LinuxDO 账户，仅用于 OAuth 登录
@@ -916,6 +831,7 @@ class PlatformManager:
 
     async def _probe_provider_availability(
         self, client: httpx.AsyncClient, provider_name: str, provider: ProviderConfig,
+        timeout: httpx.Timeout | None = None,
     ) -> tuple[bool, str]:
         """探测站点可用性：仅保留可访问站点，避免无效站点进入签到流程。"""
         status_ok = {200, 201, 202, 204, 301, 302, 307, 308, 400, 401, 403, 405, 429}
@@ -927,7 +843,9 @@ class PlatformManager:
 
         for idx, url in enumerate(targets):
             try:
-                resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True)
+                resp = await client.get(
+                    url, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True, timeout=timeout,
+                )
                 code = resp.status_code
                 if code in status_ok:
                     return True, f"HTTP {code} ({'user_info' if idx == 0 else 'root'})"
@@ -954,10 +872,6 @@ class PlatformManager:
             write=read_timeout,
             pool=read_timeout,
         )
-        limits = httpx.Limits(
-            max_connections=max(10, probe_concurrency * 2),
-            max_keepalive_connections=max(5, probe_concurrency),
-        )
         semaphore = asyncio.Semaphore(probe_concurrency)
 
         logger.info(
@@ -968,20 +882,22 @@ class PlatformManager:
         available: dict[str, ProviderConfig] = {}
         unavailable: list[tuple[str, str]] = []
 
-        async with httpx.AsyncClient(verify=False, timeout=timeout, limits=limits) as client:
-            async def check_one(name: str, provider: ProviderConfig) -> None:
-                async with semaphore:
-                    ok, reason = await self._probe_provider_availability(client, name, provider)
-                    if ok:
-                        available[name] = provider
-                        logger.debug(f"[{name}] 站点可用: {reason}")
-                    else:
-                        unavailable.append((name, reason))
+        # 使用共享客户端：探测时建立的连接在随后的签到请求中直接复用
+        client = self._get_http_client()
 
-            await asyncio.gather(*[
-                check_one(name, provider)
-                for name, provider in providers.items()
-            ])
+        async def check_one(name: str, provider: ProviderConfig) -> None:
+            async with semaphore:
+                ok, reason = await self._probe_provider_availability(client, name, provider, timeout)
+                if ok:
+                    available[name] = provider
+                    logger.debug(f"[{name}] 站点可用: {reason}")
+                else:
+                    unavailable.append((name, reason))
+
+        await asyncio.gather(*[
+            check_one(name, provider)
+            for name, provider in providers.items()
+        ])
 
         if unavailable:
             preview = ", ".join(f"{name}({reason})" for name, reason in unavailable[:8])
@@ -1013,10 +929,9 @@ class PlatformManager:
     @staticmethod
     def _parse_newapi_provider(platform_name: str) -> str | None:
         """从平台名中解析 provider，如 'NewAPI (wong)' -> 'wong'。"""
-        prefix = "NewAPI ("
-        if not platform_name.startswith(prefix) or not platform_name.endswith(")"):
+        if not platform_name.startswith(NEWAPI_PLATFORM_PREFIX) or not platform_name.endswith(")"):
             return None
-        return platform_name[len(prefix):-1].strip() or None
+        return platform_name[len(NEWAPI_PLATFORM_PREFIX):-1].strip() or None
 
     def export_newapi_failed_sites_for_extension(self, output_path: str | None = None) -> str:
         """导出 NewAPI 失败站点报告给 Chrome 插件读取。"""
@@ -1026,7 +941,7 @@ class PlatformManager:
             for r in self.results
             if r.status == CheckinStatus.FAILED
             and isinstance(r.platform, str)
-            and r.platform.startswith("NewAPI (")
+            and r.platform.startswith(NEWAPI_PLATFORM_PREFIX)
         ]
 
         account_lookup: dict[tuple[str, str], AnyRouterAccount] = {}
@@ -1087,7 +1002,7 @@ class PlatformManager:
         target_dir = os.path.dirname(target_path) or "."
         os.makedirs(target_dir, exist_ok=True)
         with tempfile.NamedTemporaryFile(mode="w", delete=False, dir=target_dir, encoding="utf-8") as tmp:
-            json.dump(payload, tmp, ensure_ascii=False, indent=2)
+            tmp.write(json.dumps(payload, ensure_ascii=False, indent=2))
             tmp_path = tmp.name
         os.replace(tmp_path, target_path)
         logger.info(f"已导出失败站点清单到: {target_path} (count={len(failed_sites)})")
@@ -1226,7 +1141,7 @@ class PlatformManager:
         target_dir = os.path.dirname(target_path) or "."
         os.makedirs(target_dir, exist_ok=True)
         with tempfile.NamedTemporaryFile(mode="w", delete=False, dir=target_dir, encoding="utf-8") as tmp:
-            json.dump(export_data, tmp, ensure_ascii=False, indent=2)
+            tmp.write(json.dumps(export_data, ensure_ascii=False, indent=2))
             tmp_path = tmp.name
         os.replace(tmp_path, target_path)
         logger.info(
@@ -1279,83 +1194,122 @@ class PlatformManager:
             )
         content = "\n".join(content_lines)
 
-        with self.notify:
-            self.notify.send_email_with_attachments(
-                title=title,
-                content=content,
-                attachments=attachments,
-                msg_type="text",
+        # 仅走 SMTP，不使用 self.notify 的 HTTP 客户端，可与汇总通知并行发送
+        self.notify.send_email_with_attachments(
+            title=title,
+            content=content,
+            attachments=attachments,
+            msg_type="text",
+        )
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """获取 NewAPI 站点共享的 HTTP 客户端（首次调用时创建）
+
+        站点可用性探测与 Cookie 签到访问同一批站点，共用连接池后签到可直接复用探测时建立的连接。
+        Cookie 按请求传入，客户端的 Cookie Jar 拒绝保存响应里的 Cookie，避免不同账号之间串用。
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                verify=_create_ssl_context(),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
             )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """关闭共享的 HTTP 客户端"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def run_all(self) -> list[CheckinResult]:
-        """运行所有平台签到"""
+        """运行所有平台签到
+
+        NewAPI 自动模式会用同一批 LinuxDO 账号在浏览器中登录，
+        与 LinuxDO 浏览同时运行会造成同一账号并发登录，因此两者依次执行。
+        """
         self.results = []
 
-        # LinuxDO 浏览帖子
-        linuxdo_results = await self._run_all_linuxdo()
-        self.results.extend(linuxdo_results)
+        try:
+            # LinuxDO 浏览帖子
+            linuxdo_results = await self._run_all_linuxdo()
+            self.results.extend(linuxdo_results)
 
-        # NewAPI 站点签到
-        newapi_results = await self._run_all_newapi()
-        self.results.extend(newapi_results)
+            # NewAPI 站点签到
+            newapi_results = await self._run_all_newapi()
+            self.results.extend(newapi_results)
+        finally:
+            await self.aclose()
 
         return self.results
 
     async def run_platform(self, platform: str) -> list[CheckinResult]:
         """运行指定平台签到"""
         self.results = []
-        platform_lower = platform.lower()
-
-        if platform_lower == "linuxdo":
-            results = await self._run_all_linuxdo()
-            self.results.extend(results)
-        elif platform_lower == "newapi":
-            results = await self._run_all_newapi()
-            self.results.extend(results)
-        else:
+
+        method_name = self._PLATFORM_METHODS.get(platform.lower())
+        if not method_name:
             raise ValueError(f"未知平台: {platform}")
 
+        try:
+            self.results = await getattr(self, method_name)()
+        finally:
+            await self.aclose()
         return self.results
 
     async def _run_all_linuxdo(self) -> list[CheckinResult]:
-        """运行 LinuxDO 浏览帖子"""
+        """运行 LinuxDO 浏览帖子（各账号互不依赖，并发执行）"""
         if not self.config.linuxdo_accounts:
             return []
 
-        results = []
+        # 按需导入：linuxdo 模块会加载 nodriver 等浏览器库，只跑 NewAPI 时不需要
+        from platforms.linuxdo import LinuxDOAdapter
+
+        account_names: list[str] = []
+        tasks = []
         for i, account in enumerate(self.config.linuxdo_accounts):
+            account_name = account.get_display_name(i)
             if not account.browse_linuxdo:
-                logger.info(f"[{account.get_display_name(i)}] 跳过浏览帖子")
+                logger.info(f"[{account_name}] 跳过浏览帖子")
                 continue
 
-            logger.info(f"开始执行 LinuxDO 浏览: {account.get_display_name(i)}")
-
-            # 从 level 计算浏览数量：L1=多看(10个), L2=一般(7个), L3=快速(5个)
-            # 但如果用户指定了 browse_count，优先使用用户的设置
-            level = getattr(account, 'level', 2) if hasattr(account, 'level') else 2
-
+            logger.info(f"开始执行 LinuxDO 浏览: {account_name}")
             adapter = LinuxDOAdapter(
                 username=account.username,
                 password=account.password,
-                browse_count=account.browse_count,
-                account_name=account.get_display_name(i),
-                level=level,
+                cookies=account.cookies,
+                account_name=account_name,
+                browse_minutes=account.browse_minutes,
             )
+            account_names.append(account_name)
+            tasks.append(self._run_limited(adapter, self._linuxdo_semaphore))
 
-            try:
-                result = await adapter.run()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"LinuxDO 浏览异常: {e}")
-                results.append(CheckinResult(
-                    platform="LinuxDO",
-                    account=account.get_display_name(i),
+        # 单个账号失败不影响其它账号：异常统一在这里转换为失败结果
+        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+        results: list[CheckinResult] = []
+        for account_name, result in zip(account_names, raw_results):
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error(f"LinuxDO [{account_name}] 执行异常")
+                result = CheckinResult(
+                    platform=PLATFORM_LINUXDO,
+                    account=account_name,
                     status=CheckinStatus.FAILED,
-                    message=f"浏览异常: {str(e)}",
-                ))
-
+                    message=f"执行异常: {result}",
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            results.append(result)
         return results
 
+    @staticmethod
+    async def _run_limited(adapter, semaphore: asyncio.Semaphore | None = None) -> CheckinResult:
+        """运行适配器；给定 semaphore 时拿到名额后才开始执行"""
+        if semaphore is None:
+            return await adapter.run()
+        async with semaphore:
+            return await adapter.run()
+
     async def _run_all_newapi(self) -> list[CheckinResult]:
         """运行所有 NewAPI 站点签到
 
@@ -1375,6 +1329,8 @@ class PlatformManager:
         all_results: list[CheckinResult] = []
         used_seed_identities: set[tuple[str, str]] = set()
         total_accounts = len(self._linuxdo_accounts)
+        # seed 映射只依赖 NEWAPI_ACCOUNTS，本轮运行中不变，所有 LinuxDO 账号共用
+        seed_accounts = self._build_seed_accounts_by_provider()
 
         for idx, linuxdo_account in enumerate(self._linuxdo_accounts):
             linuxdo_username = linuxdo_account.get("username", "")
@@ -1388,12 +1344,13 @@ class PlatformManager:
                     account_index=idx,
                     account_total=total_accounts,
                     used_seed_identities=used_seed_identities,
+                    seed_accounts=seed_accounts,
                 )
                 all_results.extend(account_results)
             except Exception as e:
                 logger.exception(f"[{linuxdo_name}] 自动模式运行异常: {e}")
                 all_results.append(CheckinResult(
-                    platform="NewAPI",
+                    platform=PLATFORM_NEWAPI,
                     account=linuxdo_name,
                     status=CheckinStatus.FAILED,
                     message=f"自动模式运行异常: {str(e)}",
@@ -1453,6 +1410,31 @@ class PlatformManager:
         # 兜底：第一个
         return seeds[0]
 
+    @staticmethod
+    def _match_site_spec(prov_name: str, prov: ProviderConfig, specs: set[str]) -> str | None:
+        """返回命中该站点的 checkin_sites/exclude_sites 条目，未命中返回 None。
+
+        先按 provider 名称精确匹配（集合查找）；否则做模糊匹配：
+        条目是 provider 名称或显示名的子串，例如 "hotaru" 匹配 "ldoh_hotaruapi_com"。
+        名称只转换一次小写，不在每个条目上重复计算。
+        """
+        prov_lower = prov_name.lower()
+        if prov_lower in specs:
+            return prov_lower
+        display_lower = (prov.name or "").lower()
+        for spec in specs:
+            if spec in prov_lower or spec in display_lower:
+                return spec
+        return None
+
+    @staticmethod
+    def _mark_cookie_source(result: CheckinResult, label: str, login_method: str) -> None:
+        """在成功结果上标注使用的 Cookie 来源（消息后缀 + details.login_method）"""
+        result.message = f"{result.message} ({label})"
+        if result.details is None:
+            result.details = {}
+        result.details["login_method"] = login_method
+
     @staticmethod
     def _build_seed_identity(account: AnyRouterAccount) -> tuple[str, str] | None:
         """构建 seed 账号标识（provider + api_user），用于跨流程去重。"""
@@ -1511,10 +1493,7 @@ class PlatformManager:
 
             result = await self._checkin_newapi(account, provider, account_name)
             if result.status == CheckinStatus.SUCCESS:
-                result.message = f"{result.message} (NEWAPI_ACCOUNTS 独立账号)"
-                if result.details is None:
-                    result.details = {}
-                result.details["login_method"] = "newapi_accounts_standalone"
+                self._mark_cookie_source(result, "NEWAPI_ACCOUNTS 独立账号", "newapi_accounts_standalone")
 
                 cookies = account.cookies if isinstance(account.cookies, dict) else {"session": session}
                 self._cookie_cache.save(
@@ -1536,6 +1515,7 @@ class PlatformManager:
         account_index: int = 0,
         account_total: int = 1,
         used_seed_identities: set[tuple[str, str]] | None = None,
+        seed_accounts: dict[str, list[AnyRouterAccount]] | None = None,
     ) -> list[CheckinResult]:
         """自动模式：用单个 LinuxDO 账号遍历所有 NewAPI 站点，自动 OAuth 登录签到
 
@@ -1585,7 +1565,8 @@ class PlatformManager:
         )
 
         logger.info(f"自动模式[{account_progress}]: 使用 LinuxDO 账号 [{linuxdo_name}] 遍历站点")
-        seed_accounts = self._build_seed_accounts_by_provider()
+        if seed_accounts is None:
+            seed_accounts = self._build_seed_accounts_by_provider()
         if seed_accounts:
             logger.info(f"自动模式: 加载 NEWAPI_ACCOUNTS seed cookie {len(seed_accounts)} 个 provider")
 
@@ -1699,22 +1680,15 @@ class PlatformManager:
             matched_specs: set[str] = set()
 
             for prov_name, prov in providers_to_test.items():
-                prov_lower = prov_name.lower()
-                # 精确匹配
-                if prov_lower in checkin_set:
-                    filtered[prov_name] = prov
-                    matched_specs.add(prov_lower)
+                spec = self._match_site_spec(prov_name, prov, checkin_set)
+                if spec is None:
                     continue
-                # 模糊匹配：用户指定的名称是 provider 名称或显示名的子串
-                # 例如 "hotaru" 匹配 "ldoh_hotaruapi_com"，"duckcoding" 匹配 "ldoh_free_duckcoding_com"
-                for spec in checkin_set:
-                    if spec in prov_lower or spec in (prov.name or "").lower():
-                        filtered[prov_name] = prov
-                        matched_specs.add(spec)
-                        logger.debug(
-                            f"[{linuxdo_name}] checkin_sites 模糊匹配: '{spec}' → '{prov_name}'"
-                        )
-                        break
+                filtered[prov_name] = prov
+                matched_specs.add(spec)
+                if spec != prov_name.lower():
+                    logger.debug(
+                        f"[{linuxdo_name}] checkin_sites 模糊匹配: '{spec}' → '{prov_name}'"
+                    )
 
             providers_to_test = filtered
             unmatched = checkin_set - matched_specs
@@ -1742,22 +1716,10 @@ class PlatformManager:
         if exclude_sites:
             exclude_set = {s.strip().lower() for s in exclude_sites if s.strip()}
             before_count = len(providers_to_test)
-            excluded_names: set[str] = set()
-
-            for prov_name, prov in list(providers_to_test.items()):
-                prov_lower = prov_name.lower()
-                should_exclude = False
-                # 精确匹配
-                if prov_lower in exclude_set:
-                    should_exclude = True
-                else:
-                    # 模糊匹配
-                    for spec in exclude_set:
-                        if spec in prov_lower or spec in (prov.name or "").lower():
-                            should_exclude = True
-                            break
-                if should_exclude:
-                    excluded_names.add(prov_name)
+            excluded_names = {
+                prov_name for prov_name, prov in providers_to_test.items()
+                if self._match_site_spec(prov_name, prov, exclude_set) is not None
+            }
 
             providers_to_test = {
                 name: prov for name, prov in providers_to_test.items()
@@ -1777,105 +1739,36 @@ class PlatformManager:
                 self._log_auto_oauth_summary(stats, results)
                 return results
 
-        # 统计需要浏览器 OAuth 的站点（无缓存或缓存失效）
-        need_oauth = []
-        for provider_name, provider in providers_to_test.items():
-            account_name = f"{linuxdo_name}_{provider_name}"
-
-            # 1. 优先尝试 NEWAPI_ACCOUNTS seed cookie（补充来源，不是主流程）
-            # 支持多账号：按 LinuxDO 账号名匹配对应的 seed（同 provider 可能有多个不同用户）
-            seed_list = seed_accounts.get(provider_name)
-            seed_account = self._match_seed_for_linuxdo(seed_list, linuxdo_name, account_index) if seed_list else None
-            if seed_account and used_seed_identities is not None:
-                seed_identity = self._build_seed_identity(seed_account)
-                if seed_identity:
-                    used_seed_identities.add(seed_identity)
-            if seed_account:
-                logger.info(f"[{account_name}] 发现 NEWAPI_ACCOUNTS seed（api_user={seed_account.api_user}），优先尝试")
-                try:
-                    seed_result = await self._checkin_newapi(seed_account, provider, account_name)
-                    if seed_result.status == CheckinStatus.SUCCESS:
-                        seed_result.message = f"{seed_result.message} (NEWAPI_ACCOUNTS seed)"
-                        if seed_result.details is None:
-                            seed_result.details = {}
-                        seed_result.details["login_method"] = "newapi_accounts_seed"
-                        results.append(seed_result)
-                        # seed 成功后同步写入持久化缓存
-                        seed_session = self._extract_session_cookie(seed_account.cookies)
-                        if seed_session and seed_account.api_user:
-                            seed_cookies = (
-                                seed_account.cookies
-                                if isinstance(seed_account.cookies, dict)
-                                else {"session": seed_session}
-                            )
-                            self._cookie_cache.save(
-                                provider_name,
-                                account_name,
-                                seed_session,
-                                str(seed_account.api_user),
-                                cookies=seed_cookies,
-                            )
-                        logger.success(f"[{account_name}] NEWAPI_ACCOUNTS seed 签到成功")
-                        continue
-
-                    seed_msg = seed_result.message or ""
-                    if "401" in seed_msg or "403" in seed_msg or "过期" in seed_msg:
-                        logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 已失效，继续尝试缓存/OAuth")
-                    else:
-                        logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 失败: {seed_msg}")
-                        results.append(seed_result)
-                        continue
-                except Exception as e:
-                    logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 尝试异常: {e}")
-
-            # 2. 尝试 GitHub 持久化缓存 Cookie
-            cached = self._cookie_cache.get(provider_name, account_name)
-            if cached:
-                stats["cookie_hit"] = int(stats["cookie_hit"]) + 1
-                logger.info(f"[{account_name}] 发现缓存Cookie，尝试Cookie+API签到...")
-                try:
-                    cached_account = AnyRouterAccount(
-                        cookies=(
-                            cached.get("cookies")
-                            if isinstance(cached.get("cookies"), dict)
-                            else {"session": cached["session"]}
-                        ),
-                        api_user=cached["api_user"],
-                        provider=provider_name,
-                        name=account_name,
-                    )
-                    result = await self._checkin_newapi(cached_account, provider, account_name)
+        # 先用已有 Cookie 签到：各站点互不依赖，并发执行（NEWAPI_CONCURRENCY 限制同时进行的站点数）
+        site_semaphore = asyncio.Semaphore(self._env_int("NEWAPI_CONCURRENCY", 5, min_value=1))
+        # WAF 站点签到要启动浏览器（获取 WAF Cookie + 浏览器内签到），逐个执行，
+        # 避免在 CI 上同时拉起多个 Chromium；先排队再占用并发名额，不挤占纯 HTTP 站点
+        waf_semaphore = asyncio.Semaphore(1)
+
+        async def _checkin_site(provider_name: str, provider: ProviderConfig) -> CheckinResult | None:
+            waf_guard = waf_semaphore if provider.needs_waf_cookies() else contextlib.nullcontext()
+            async with waf_guard, site_semaphore:
+                return await self._checkin_with_saved_cookie(
+                    provider_name, provider, linuxdo_name, account_index,
+                    seed_accounts, used_seed_identities, stats,
+                )
 
-                    if result.status == CheckinStatus.SUCCESS:
-                        result.message = f"{result.message} (缓存Cookie)"
-                        if result.details is None:
-                            result.details = {}
-                        result.details["login_method"] = "cached_cookie"
-                        results.append(result)
-                        stats["cookie_success"] = int(stats["cookie_success"]) + 1
-                        logger.success(f"[{account_name}] 缓存Cookie签到成功！")
-                        continue
+        site_results = await asyncio.gather(
+            *(_checkin_site(provider_name, provider) for provider_name, provider in providers_to_test.items())
+        )
 
-                    # Cookie 过期，清除缓存，需要 OAuth
-                    msg = result.message or ""
-                    if "401" in msg or "403" in msg or "过期" in msg:
-                        logger.warning(f"[{account_name}] 缓存Cookie已失效，需要重新OAuth")
-                        self._cookie_cache.invalidate(provider_name, account_name)
-                        stats["cookie_invalidated"] = int(stats["cookie_invalidated"]) + 1
-                    else:
-                        logger.warning(f"[{account_name}] 签到失败: {msg}")
-                        results.append(result)
-                        continue
-                except Exception as e:
-                    logger.warning(f"[{account_name}] 缓存Cookie签到异常: {e}")
-                    self._cookie_cache.invalidate(provider_name, account_name)
-                    stats["cookie_invalidated"] = int(stats["cookie_invalidated"]) + 1
+        # 统计需要浏览器 OAuth 的站点（无缓存或缓存失效），结果按站点顺序汇总
+        need_oauth = []
+        for (provider_name, provider), site_result in zip(providers_to_test.items(), site_results):
+            if site_result is not None:
+                results.append(site_result)
+                continue
 
-            # 3. seed/cache 均不可用，标记为需要 OAuth
+            # seed/cache 均不可用，标记为需要 OAuth
             need_oauth.append({
                 "provider": provider,
                 "provider_name": provider_name,
-                "account_name": account_name,
+                "account_name": f"{linuxdo_name}_{provider_name}",
             })
         stats["oauth_needed"] = len(need_oauth)
 
@@ -1947,7 +1840,7 @@ class PlatformManager:
                     logger.error(f"[{account_name}] 超时（>{site_timeout}s），跳过")
                     stats["oauth_failed"] = int(stats["oauth_failed"]) + 1
                     results.append(CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message=f"OAuth 超时（>{site_timeout}s）",
@@ -1958,7 +1851,7 @@ class PlatformManager:
                     if self._is_retryable_network_error(e):
                         stats["oauth_network_failed"] = int(stats["oauth_network_failed"]) + 1
                     results.append(CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message=f"OAuth 异常: {str(e)}",
@@ -1978,6 +1871,104 @@ class PlatformManager:
         self._log_auto_oauth_summary(stats, results)
         return results
 
+    async def _checkin_with_saved_cookie(
+        self,
+        provider_name: str,
+        provider: ProviderConfig,
+        linuxdo_name: str,
+        account_index: int,
+        seed_accounts: dict[str, list[AnyRouterAccount]],
+        used_seed_identities: set[tuple[str, str]] | None,
+        stats: dict[str, int | str],
+    ) -> CheckinResult | None:
+        """用已有 Cookie（NEWAPI_ACCOUNTS seed → 持久化缓存）签到单个站点
+
+        Returns:
+            签到结果；seed/缓存均不可用（需要浏览器 OAuth）时返回 None
+        """
+        account_name = f"{linuxdo_name}_{provider_name}"
+
+        # 1. 优先尝试 NEWAPI_ACCOUNTS seed cookie（补充来源，不是主流程）
+        # 支持多账号：按 LinuxDO 账号名匹配对应的 seed（同 provider 可能有多个不同用户）
+        seed_list = seed_accounts.get(provider_name)
+        seed_account = self._match_seed_for_linuxdo(seed_list, linuxdo_name, account_index) if seed_list else None
+        if seed_account and used_seed_identities is not None:
+            seed_identity = self._build_seed_identity(seed_account)
+            if seed_identity:
+                used_seed_identities.add(seed_identity)
+        if seed_account:
+            logger.info(f"[{account_name}] 发现 NEWAPI_ACCOUNTS seed（api_user={seed_account.api_user}），优先尝试")
+            try:
+                seed_result = await self._checkin_newapi(seed_account, provider, account_name)
+                if seed_result.status == CheckinStatus.SUCCESS:
+                    self._mark_cookie_source(seed_result, "NEWAPI_ACCOUNTS seed", "newapi_accounts_seed")
+                    # seed 成功后同步写入持久化缓存
+                    seed_session = self._extract_session_cookie(seed_account.cookies)
+                    if seed_session and seed_account.api_user:
+                        seed_cookies = (
+                            seed_account.cookies
+                            if isinstance(seed_account.cookies, dict)
+                            else {"session": seed_session}
+                        )
+                        self._cookie_cache.save(
+                            provider_name,
+                            account_name,
+                            seed_session,
+                            str(seed_account.api_user),
+                            cookies=seed_cookies,
+                        )
+                    logger.success(f"[{account_name}] NEWAPI_ACCOUNTS seed 签到成功")
+                    return seed_result
+
+                seed_msg = seed_result.message or ""
+                if "401" in seed_msg or "403" in seed_msg or "过期" in seed_msg:
+                    logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 已失效，继续尝试缓存/OAuth")
+                else:
+                    logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 失败: {seed_msg}")
+                    return seed_result
+            except Exception as e:
+                logger.warning(f"[{account_name}] NEWAPI_ACCOUNTS seed 尝试异常: {e}")
+
+        # 2. 尝试 GitHub 持久化缓存 Cookie
+        cached = self._cookie_cache.get(provider_name, account_name)
+        if cached:
+            stats["cookie_hit"] = int(stats["cookie_hit"]) + 1
+            logger.info(f"[{account_name}] 发现缓存Cookie，尝试Cookie+API签到...")
+            try:
+                cached_account = AnyRouterAccount(
+                    cookies=(
+                        cached.get("cookies")
+                        if isinstance(cached.get("cookies"), dict)
+                        else {"session": cached["session"]}
+                    ),
+                    api_user=cached["api_user"],
+                    provider=provider_name,
+                    name=account_name,
+                )
+                result = await self._checkin_newapi(cached_account, provider, account_name)
+
+                if result.status == CheckinStatus.SUCCESS:
+                    self._mark_cookie_source(result, "缓存Cookie", "cached_cookie")
+                    stats["cookie_success"] = int(stats["cookie_success"]) + 1
+                    logger.success(f"[{account_name}] 缓存Cookie签到成功！")
+                    return result
+
+                # Cookie 过期，清除缓存，需要 OAuth
+                msg = result.message or ""
+                if "401" in msg or "403" in msg or "过期" in msg:
+                    logger.warning(f"[{account_name}] 缓存Cookie已失效，需要重新OAuth")
+                    self._cookie_cache.invalidate(provider_name, account_name)
+                    stats["cookie_invalidated"] = int(stats["cookie_invalidated"]) + 1
+                else:
+                    logger.warning(f"[{account_name}] 签到失败: {msg}")
+                    return result
+            except Exception as e:
+                logger.warning(f"[{account_name}] 缓存Cookie签到异常: {e}")
+                self._cookie_cache.invalidate(provider_name, account_name)
+                stats["cookie_invalidated"] = int(stats["cookie_invalidated"]) + 1
+
+        return None
+
     async def _oauth_single_site_shared(
         self, tab, browser_mgr, provider, provider_name: str,
         account_name: str, linuxdo_username: str, linuxdo_password: str,
@@ -2005,7 +1996,7 @@ class PlatformManager:
 
                 if not session_cookie:
                     return CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message="OAuth 登录失败，无法获取 session",
@@ -2030,7 +2021,7 @@ class PlatformManager:
                 details["_cached_cookies"] = runtime_cookies or {"session": session_cookie}
 
                 return CheckinResult(
-                    platform=f"NewAPI ({provider_name})",
+                    platform=_newapi_platform_label(provider_name),
                     account=account_name,
                     status=CheckinStatus.SUCCESS if success else CheckinStatus.FAILED,
                     message=message,
@@ -2052,7 +2043,7 @@ class PlatformManager:
                         f"[{account_name}] 共享OAuth网络不可达（重试{retry_count}次后失败）: {e}"
                     )
                     return CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message=f"OAuth 网络不可达: {str(e)}",
@@ -2060,7 +2051,7 @@ class PlatformManager:
 
                 logger.error(f"[{account_name}] 共享OAuth异常: {e}")
                 return CheckinResult(
-                    platform=f"NewAPI ({provider_name})",
+                    platform=_newapi_platform_label(provider_name),
                     account=account_name,
                     status=CheckinStatus.FAILED,
                     message=f"OAuth 异常: {str(e)}",
@@ -2147,7 +2138,7 @@ class PlatformManager:
                         await asyncio.sleep(delay)
                         continue
                     final_result = CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message=f"OAuth 超时（>{site_timeout}s）",
@@ -2164,7 +2155,7 @@ class PlatformManager:
                         await asyncio.sleep(delay)
                         continue
                     final_result = CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
+                        platform=_newapi_platform_label(provider_name),
                         account=account_name,
                         status=CheckinStatus.FAILED,
                         message=(
@@ -2177,7 +2168,7 @@ class PlatformManager:
 
             if final_result is None:
                 final_result = CheckinResult(
-                    platform=f"NewAPI ({provider_name})",
+                    platform=_newapi_platform_label(provider_name),
                     account=account_name,
                     status=CheckinStatus.FAILED,
                     message="OAuth 未知失败",
@@ -2191,276 +2182,6 @@ class PlatformManager:
                     if self._is_retryable_network_message(final_result.message or ""):
                         stats["oauth_network_failed"] = int(stats.get("oauth_network_failed", 0)) + 1
 
-    async def _run_newapi_with_accounts(self) -> list[CheckinResult]:
-        """手动模式：使用 NEWAPI_ACCOUNTS 中预配置的账号签到"""
-        results = []
-        # 记录需要浏览器回退的账户
-        failed_accounts = []
-
-        for i, account in enumerate(self.config.anyrouter_accounts):
-            account_name = account.get_display_name(i)
-            provider_name = account.provider
-
-            # 获取 provider 配置
-            provider = self.config.providers.get(provider_name)
-            if not provider:
-                # 尝试从默认配置获取
-                if provider_name in DEFAULT_PROVIDERS:
-                    from utils.config import ProviderConfig
-                    provider = ProviderConfig.from_dict(provider_name, DEFAULT_PROVIDERS[provider_name])
-                else:
-                    logger.warning(f"[{account_name}] Provider '{provider_name}' 未找到，跳过")
-                    results.append(CheckinResult(
-                        platform=f"NewAPI ({provider_name})",
-                        account=account_name,
-                        status=CheckinStatus.SKIPPED,
-                        message=f"Provider '{provider_name}' 未配置",
-                    ))
-                    continue
-
-            logger.info(f"开始签到: {account_name} ({provider_name})")
-            logger.info(f"[{account_name}] 优先使用 GitHub 持久化Cookie，其次 NEWAPI_ACCOUNTS Cookie")
-
-            # 检查是否需要直接使用浏览器 OAuth（某些站点有 Cloudflare 保护）
-            if provider.bypass_method == "browser_oauth":
-                logger.info(f"[{account_name}] 站点需要浏览器 OAuth 登录")
-                failed_accounts.append({
-                    "account": account,
-                    "provider": provider,
-                    "account_name": account_name,
-                    "original_result": None,
-                })
-                continue
-
-            # ===== 1) GitHub 持久化缓存 Cookie 优先 =====
-            cached = self._cookie_cache.get(provider_name, account_name)
-            if cached:
-                logger.info(f"[{account_name}] 检测到持久化Cookie，优先尝试")
-                try:
-                    cached_account = AnyRouterAccount(
-                        cookies=(
-                            cached.get("cookies")
-                            if isinstance(cached.get("cookies"), dict)
-                            else {"session": cached["session"]}
-                        ),
-                        api_user=cached["api_user"],
-                        provider=account.provider,
-                        name=account.name,
-                    )
-                    cached_result = await self._checkin_newapi(cached_account, provider, account_name)
-                    if cached_result.status == CheckinStatus.SUCCESS:
-                        cached_result.message = f"{cached_result.message} (GitHub持久化Cookie)"
-                        if cached_result.details is None:
-                            cached_result.details = {}
-                        cached_result.details["login_method"] = "github_persisted_cookie"
-                        results.append(cached_result)
-                        logger.success(f"[{account_name}] 持久化Cookie签到成功")
-                        continue
-
-                    msg = cached_result.message or ""
-                    if "401" in msg or "403" in msg or "过期" in msg:
-                        logger.warning(f"[{account_name}] 持久化Cookie已失效，删除缓存")
-                        self._cookie_cache.invalidate(provider_name, account_name)
-                    else:
-                        logger.warning(f"[{account_name}] 持久化Cookie尝试失败，继续用配置Cookie: {msg}")
-                except Exception as e:
-                    logger.warning(f"[{account_name}] 持久化Cookie尝试异常，删除缓存后继续: {e}")
-                    self._cookie_cache.invalidate(provider_name, account_name)
-
-            try:
-                result = await self._checkin_newapi(account, provider, account_name)
-
-                # 检查是否需要浏览器回退（401/403 错误）
-                if result.status == CheckinStatus.FAILED:
-                    msg = result.message or ""
-                    if "401" in msg or "403" in msg or "过期" in msg:
-                        logger.warning(f"[{account_name}] 配置Cookie失效，准备回退处理")
-
-                        # 若当前是覆盖cookie，先删除覆盖并恢复 NEWAPI_ACCOUNTS 原始值再试一次
-                        if id(account) in self._newapi_override_applied_accounts:
-                            logger.warning(f"[{account_name}] 当前为覆盖Cookie且已失效，删除覆盖并恢复原始配置重试")
-                            self._remove_newapi_account_override(account, provider_name)
-                            restored = self._restore_newapi_account_original(account)
-                            if restored:
-                                # 覆盖失效时，相关持久化缓存也同步清理
-                                self._cookie_cache.invalidate(provider_name, account_name)
-                                try:
-                                    restored_result = await self._checkin_newapi(account, provider, account_name)
-                                    if restored_result.status == CheckinStatus.SUCCESS:
-                                        restored_result.message = f"{restored_result.message} (恢复原始NEWAPI_ACCOUNTS)"
-                                        if restored_result.details is None:
-                                            restored_result.details = {}
-                                        restored_result.details["login_method"] = "newapi_accounts_restored"
-                                        results.append(restored_result)
-                                        logger.success(f"[{account_name}] 恢复原始配置Cookie后签到成功")
-                                        continue
-                                    msg2 = restored_result.message or ""
-                                    if "401" not in msg2 and "403" not in msg2 and "过期" not in msg2:
-                                        results.append(restored_result)
-                                        continue
-                                except Exception as e:
-                                    logger.warning(f"[{account_name}] 恢复原始配置后重试异常: {e}")
-
-                        # NEWAPI_ACCOUNTS 当前 cookie 失败后，最后再尝试一次本地缓存 cookie（若仍存在）
-                        cached = self._cookie_cache.get(provider_name, account_name)
-                        if cached:
-                            logger.info(f"[{account_name}] 检测到缓存Cookie，作为最终兜底再尝试一次")
-                            try:
-                                cached_account = AnyRouterAccount(
-                                    cookies=(
-                                        cached.get("cookies")
-                                        if isinstance(cached.get("cookies"), dict)
-                                        else {"session": cached["session"]}
-                                    ),
-                                    api_user=cached["api_user"],
-                                    provider=account.provider,
-                                    name=account.name,
-                                )
-                                cached_result = await self._checkin_newapi(cached_account, provider, account_name)
-                                if cached_result.status == CheckinStatus.SUCCESS:
-                                    cached_result.message = f"{cached_result.message} (缓存Cookie最终兜底)"
-                                    if cached_result.details is None:
-                                        cached_result.details = {}
-                                    cached_result.details["login_method"] = "cached_cookie_last_fallback"
-                                    results.append(cached_result)
-                                    logger.success(f"[{account_name}] 缓存Cookie最终兜底签到成功！")
-                                    continue
-                                msg3 = cached_result.message or ""
-                                if "401" in msg3 or "403" in msg3 or "过期" in msg3:
-                                    self._cookie_cache.invalidate(provider_name, account_name)
-                            except Exception as e:
-                                logger.warning(f"[{account_name}] 缓存Cookie兜底异常: {e}")
-
-                        failed_accounts.append({
-                            "account": account,
-                            "provider": provider,
-                            "account_name": account_name,
-                            "original_result": result,
-                        })
-                        continue  # 先不添加结果，等浏览器回退后再添加
-
-                results.append(result)
-            except Exception as e:
-                logger.error(f"[{account_name}] 签到异常: {e}")
-                results.append(CheckinResult(
-                    platform=f"NewAPI ({provider_name})",
-                    account=account_name,
-                    status=CheckinStatus.FAILED,
-                    message=f"签到异常: {str(e)}",
-                ))
-
-        # 处理需要浏览器回退的账户
-        if failed_accounts and self._linuxdo_accounts:
-            logger.info(f"开始浏览器回退登录，共 {len(failed_accounts)} 个失败账户")
-            browser_results = await self._browser_fallback_checkin(failed_accounts)
-            results.extend(browser_results)
-        elif failed_accounts:
-            # 没有 LinuxDO 账户，直接返回失败结果
-            logger.warning("没有配置 LinuxDO 账户，无法进行浏览器回退登录")
-            for item in failed_accounts:
-                original_result = item.get("original_result")
-                if original_result:
-                    results.append(original_result)
-                else:
-                    # 对于需要浏览器 OAuth 但没有 LinuxDO 账户的情况
-                    results.append(CheckinResult(
-                        platform=f"NewAPI ({item['provider'].name})",
-                        account=item['account_name'],
-                        status=CheckinStatus.FAILED,
-                        message="需要浏览器 OAuth 登录但未配置 LinuxDO 账户",
-                    ))
-
-        return results
-
-    async def _browser_fallback_checkin(self, failed_accounts: list[dict]) -> list[CheckinResult]:
-        """使用浏览器 OAuth 登录进行回退签到"""
-        from platforms.newapi_browser import browser_checkin_newapi
-
-        results = []
-        # 使用第一个 LinuxDO 账户进行登录
-        linuxdo_account = self._linuxdo_accounts[0]
-        linuxdo_username = linuxdo_account["username"]
-        linuxdo_password = linuxdo_account["password"]
-
-        logger.info(f"使用 LinuxDO 账户 [{linuxdo_account.get('name', linuxdo_username)}] 进行浏览器回退登录")
-
-        for item in failed_accounts:
-            account = item["account"]
-            provider = item["provider"]
-            account_name = item["account_name"]
-
-            logger.info(f"[{account_name}] 尝试浏览器 OAuth 登录...")
-
-            try:
-                # 使用浏览器签到模块
-                result = await browser_checkin_newapi(
-                    provider_name=provider.name,
-                    linuxdo_username=linuxdo_username,
-                    linuxdo_password=linuxdo_password,
-                    cookies=account.cookies if hasattr(account, 'cookies') else None,
-                    api_user=account.api_user if hasattr(account, 'api_user') else None,
-                    account_name=account_name,
-                )
-
-                if result.status == CheckinStatus.SUCCESS:
-                    logger.success(f"[{account_name}] 浏览器回退签到成功！")
-
-                    # 缓存 OAuth 获取的新 Cookie，下次直接用 Cookie+API（更快）
-                    if result.details:
-                        cached_session = result.details.pop("_cached_session", None)
-                        cached_api_user = result.details.pop("_cached_api_user", None)
-                        cached_cookies = result.details.pop("_cached_cookies", None)
-                        if cached_session and cached_api_user:
-                            self._cookie_cache.save(
-                                provider.name,
-                                account_name,
-                                cached_session,
-                                cached_api_user,
-                                cookies=(
-                                    cached_cookies
-                                    if isinstance(cached_cookies, dict)
-                                    else {"session": cached_session}
-                                ),
-                            )
-                            logger.success(
-                                f"[{account_name}] 新Cookie已缓存，下次将优先使用Cookie+API方式"
-                            )
-                            # 同步覆盖 NEWAPI_ACCOUNTS（通过覆盖文件持久化）
-                            self._persist_newapi_account_override(
-                                account=account,
-                                account_name=account_name,
-                                provider_name=provider.name,
-                                session_cookie=cached_session,
-                                api_user=cached_api_user,
-                                cookies=(
-                                    cached_cookies
-                                    if isinstance(cached_cookies, dict)
-                                    else {"session": cached_session}
-                                ),
-                                source="oauth_refresh",
-                            )
-                else:
-                    logger.error(f"[{account_name}] 浏览器回退签到失败: {result.message}")
-
-                results.append(result)
-
-            except Exception as e:
-                logger.error(f"[{account_name}] 浏览器回退签到异常: {e}")
-                # 返回原始失败结果或创建新的失败结果
-                original_result = item.get("original_result")
-                if original_result:
-                    original_result.message = f"{original_result.message} (浏览器回退也失败: {e})"
-                    results.append(original_result)
-                else:
-                    results.append(CheckinResult(
-                        platform=f"NewAPI ({provider.name})",
-                        account=account_name,
-                        status=CheckinStatus.FAILED,
-                        message=f"浏览器 OAuth 登录失败: {e}",
-                    ))
-
-        return results
-
     async def _checkin_newapi(self, account, provider, account_name: str) -> CheckinResult:
         """执行单个 NewAPI 站点签到"""
         # 提取 cookie（优先使用完整 cookie bundle，至少包含 session）
@@ -2475,7 +2196,7 @@ class PlatformManager:
         session_cookie = cookies.get("session") or self._extract_session_cookie(account.cookies)
         if not session_cookie:
             return CheckinResult(
-                platform=f"NewAPI ({provider.name})",
+                platform=_newapi_platform_label(provider.name),
                 account=account_name,
                 status=CheckinStatus.FAILED,
                 message="无效的 session cookie",
@@ -2503,112 +2224,111 @@ class PlatformManager:
             else:
                 logger.warning(f"[{account_name}] 无法获取 WAF cookies，尝试直接请求")
 
-        ssl_ctx = _create_ssl_context()
-
         # 对需要 WAF bypass 的站点使用浏览器直接请求（CDN 阻止非浏览器 TLS）
         if provider.needs_waf_cookies():
             return await self._checkin_newapi_browser(provider, account_name, headers, cookies, details)
 
-        async with httpx.AsyncClient(timeout=30.0, verify=ssl_ctx) as client:
-            # 1. 获取用户信息
-            user_info_url = f"{provider.domain}{provider.user_info_path}"
+        client = self._get_http_client()
+
+        # 1. 获取用户信息
+        user_info_url = f"{provider.domain}{provider.user_info_path}"
+        try:
+            resp = await client.get(user_info_url, headers=headers, cookies=cookies)
+            if resp.status_code == 200:
+                data = resp.json()
+                if data.get("success"):
+                    user_data = data.get("data", {})
+                    quota = round(user_data.get("quota", 0) / 500000, 2)
+                    used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
+                    details["balance"] = f"${quota}"
+                    details["used"] = f"${used_quota}"
+                    logger.info(f"[{account_name}] 余额: ${quota}, 已用: ${used_quota}")
+        except Exception as e:
+            logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
+
+        # 2. 执行签到（如果需要）
+        if provider.needs_manual_check_in():
+            checkin_url = f"{provider.domain}{provider.sign_in_path}"
             try:
-                resp = await client.get(user_info_url, headers=headers, cookies=cookies)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if data.get("success"):
-                        user_data = data.get("data", {})
-                        quota = round(user_data.get("quota", 0) / 500000, 2)
-                        used_quota = round(user_data.get("used_quota", 0) / 500000, 2)
-                        details["balance"] = f"${quota}"
-                        details["used"] = f"${used_quota}"
-                        logger.info(f"[{account_name}] 余额: ${quota}, 已用: ${used_quota}")
-            except Exception as e:
-                logger.warning(f"[{account_name}] 获取用户信息失败: {e}")
+                resp = await client.post(checkin_url, headers=headers, cookies=cookies)
+                logger.debug(f"[{account_name}] 签到响应: {resp.status_code}")
 
-            # 2. 执行签到（如果需要）
-            if provider.needs_manual_check_in():
-                checkin_url = f"{provider.domain}{provider.sign_in_path}"
-                try:
-                    resp = await client.post(checkin_url, headers=headers, cookies=cookies)
-                    logger.debug(f"[{account_name}] 签到响应: {resp.status_code}")
-
-                    if resp.status_code == 200:
-                        try:
-                            result = resp.json()
-                            msg = result.get("message") or result.get("msg") or ""
-
-                            # 检查各种成功标志
-                            if result.get("success") or result.get("ret") == 1 or result.get("code") == 0:
-                                msg = msg or "签到成功"
-                                logger.success(f"[{account_name}] {msg}")
-                                return CheckinResult(
-                                    platform=f"NewAPI ({provider.name})",
-                                    account=account_name,
-                                    status=CheckinStatus.SUCCESS,
-                                    message=msg,
-                                    details=details if details else None,
-                                )
-                            # "今日已签到" 也视为成功（只是今天已经签过了）
-                            elif "已签到" in msg or "已经签到" in msg:
-                                logger.success(f"[{account_name}] {msg}")
-                                return CheckinResult(
-                                    platform=f"NewAPI ({provider.name})",
-                                    account=account_name,
-                                    status=CheckinStatus.SUCCESS,
-                                    message=msg,
-                                    details=details if details else None,
-                                )
-                            else:
-                                error_msg = msg or "签到失败"
-                                logger.warning(f"[{account_name}] {error_msg}")
-                                return CheckinResult(
-                                    platform=f"NewAPI ({provider.name})",
-                                    account=account_name,
-                                    status=CheckinStatus.FAILED,
-                                    message=error_msg,
-                                    details=details if details else None,
-                                )
-                        except Exception:
-                            # 非 JSON 响应
-                            if "success" in resp.text.lower():
-                                logger.success(f"[{account_name}] 签到成功")
-                                return CheckinResult(
-                                    platform=f"NewAPI ({provider.name})",
-                                    account=account_name,
-                                    status=CheckinStatus.SUCCESS,
-                                    message="签到成功",
-                                    details=details if details else None,
-                                )
+                if resp.status_code == 200:
+                    try:
+                        result = resp.json()
+                        msg = result.get("message") or result.get("msg") or ""
+
+                        # 检查各种成功标志
+                        if result.get("success") or result.get("ret") == 1 or result.get("code") == 0:
+                            msg = msg or "签到成功"
+                            logger.success(f"[{account_name}] {msg}")
+                            return CheckinResult(
+                                platform=_newapi_platform_label(provider.name),
+                                account=account_name,
+                                status=CheckinStatus.SUCCESS,
+                                message=msg,
+                                details=details if details else None,
+                            )
+                        # "今日已签到" 也视为成功（只是今天已经签过了）
+                        elif "已签到" in msg or "已经签到" in msg:
+                            logger.success(f"[{account_name}] {msg}")
+                            return CheckinResult(
+                                platform=_newapi_platform_label(provider.name),
+                                account=account_name,
+                                status=CheckinStatus.SUCCESS,
+                                message=msg,
+                                details=details if details else None,
+                            )
+                        else:
+                            error_msg = msg or "签到失败"
+                            logger.warning(f"[{account_name}] {error_msg}")
+                            return CheckinResult(
+                                platform=_newapi_platform_label(provider.name),
+                                account=account_name,
+                                status=CheckinStatus.FAILED,
+                                message=error_msg,
+                                details=details if details else None,
+                            )
+                    except Exception:
+                        # 非 JSON 响应
+                        if "success" in resp.text.lower():
+                            logger.success(f"[{account_name}] 签到成功")
+                            return CheckinResult(
+                                platform=_newapi_platform_label(provider.name),
+                                account=account_name,
+                                status=CheckinStatus.SUCCESS,
+                                message="签到成功",
+                                details=details if details else None,
+                            )
 
-                    logger.error(f"[{account_name}] 签到失败: HTTP {resp.status_code}")
-                    return CheckinResult(
-                        platform=f"NewAPI ({provider.name})",
-                        account=account_name,
-                        status=CheckinStatus.FAILED,
-                        message=f"HTTP {resp.status_code}",
-                        details=details if details else None,
-                    )
+                logger.error(f"[{account_name}] 签到失败: HTTP {resp.status_code}")
+                return CheckinResult(
+                    platform=_newapi_platform_label(provider.name),
+                    account=account_name,
+                    status=CheckinStatus.FAILED,
+                    message=f"HTTP {resp.status_code}",
+                    details=details if details else None,
+                )
 
-                except Exception as e:
-                    logger.error(f"[{account_name}] 签到请求异常: {e}")
-                    return CheckinResult(
-                        platform=f"NewAPI ({provider.name})",
-                        account=account_name,
-                        status=CheckinStatus.FAILED,
-                        message=f"请求异常: {str(e)}",
-                        details=details if details else None,
-                    )
-            else:
-                # 不需要手动签到（访问用户信息即自动签到）
-                logger.success(f"[{account_name}] 签到成功（自动触发）")
+            except Exception as e:
+                logger.error(f"[{account_name}] 签到请求异常: {e}")
                 return CheckinResult(
-                    platform=f"NewAPI ({provider.name})",
+                    platform=_newapi_platform_label(provider.name),
                     account=account_name,
-                    status=CheckinStatus.SUCCESS,
-                    message="签到成功（自动触发）",
+                    status=CheckinStatus.FAILED,
+                    message=f"请求异常: {str(e)}",
                     details=details if details else None,
                 )
+        else:
+            # 不需要手动签到（访问用户信息即自动签到）
+            logger.success(f"[{account_name}] 签到成功（自动触发）")
+            return CheckinResult(
+                platform=_newapi_platform_label(provider.name),
+                account=account_name,
+                status=CheckinStatus.SUCCESS,
+                message="签到成功（自动触发）",
+                details=details if details else None,
+            )
 
     async def _checkin_newapi_browser(
         self, provider, account_name: str, headers: dict, cookies: dict, details: dict,
@@ -2726,7 +2446,7 @@ class PlatformManager:
 
                                     logger.success(f"[{account_name}] {msg}")
                                     return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
+                                        platform=_newapi_platform_label(provider.name),
                                         account=account_name,
                                         status=CheckinStatus.SUCCESS,
                                         message=msg,
@@ -2735,7 +2455,7 @@ class PlatformManager:
                                 elif "已签到" in msg or "已经签到" in msg:
                                     logger.success(f"[{account_name}] {msg}")
                                     return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
+                                        platform=_newapi_platform_label(provider.name),
                                         account=account_name,
                                         status=CheckinStatus.SUCCESS,
                                         message=msg,
@@ -2745,7 +2465,7 @@ class PlatformManager:
                                     error_msg = msg or "签到失败"
                                     logger.warning(f"[{account_name}] {error_msg}")
                                     return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
+                                        platform=_newapi_platform_label(provider.name),
                                         account=account_name,
                                         status=CheckinStatus.FAILED,
                                         message=error_msg,
@@ -2754,7 +2474,7 @@ class PlatformManager:
                             except json.JSONDecodeError:
                                 if "success" in resp["text"].lower():
                                     return CheckinResult(
-                                        platform=f"NewAPI ({provider.name})",
+                                        platform=_newapi_platform_label(provider.name),
                                         account=account_name,
                                         status=CheckinStatus.SUCCESS,
                                         message="签到成功",
@@ -2763,7 +2483,7 @@ class PlatformManager:
 
                         logger.error(f"[{account_name}] 签到失败: HTTP {resp['status']}, body={resp['text'][:200]}")
                         return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
+                            platform=_newapi_platform_label(provider.name),
                             account=account_name,
                             status=CheckinStatus.FAILED,
                             message=f"HTTP {resp['status']}",
@@ -2772,7 +2492,7 @@ class PlatformManager:
                     except Exception as e:
                         logger.error(f"[{account_name}] 签到请求异常: {e}")
                         return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
+                            platform=_newapi_platform_label(provider.name),
                             account=account_name,
                             status=CheckinStatus.FAILED,
                             message=f"请求异常: {str(e)}",
@@ -2783,7 +2503,7 @@ class PlatformManager:
                     if details:
                         logger.success(f"[{account_name}] 签到成功（自动触发）")
                         return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
+                            platform=_newapi_platform_label(provider.name),
                             account=account_name,
                             status=CheckinStatus.SUCCESS,
                             message="签到成功（自动触发）",
@@ -2792,7 +2512,7 @@ class PlatformManager:
                     else:
                         logger.warning(f"[{account_name}] 无法确认签到状态（用户信息获取失败）")
                         return CheckinResult(
-                            platform=f"NewAPI ({provider.name})",
+                            platform=_newapi_platform_label(provider.name),
                             account=account_name,
                             status=CheckinStatus.FAILED,
                             message="无法确认签到状态",
@@ -2861,7 +2581,6 @@ class PlatformManager:
                     await page.wait_for_timeout(1000)
 
                 # 等待页面完全加载
-                import contextlib
                 with contextlib.suppress(Exception):
                     await page.wait_for_load_state("networkidle", timeout=10000)
 
@@ -2909,24 +2628,39 @@ class PlatformManager:
         with self.notify:
             self.notify.push_message(title, html_content, msg_type="html")
 
+    @property
+    def results(self) -> list[CheckinResult]:
+        return self._results
+
+    @results.setter
+    def results(self, value: list[CheckinResult]) -> None:
+        # 结果整体替换时清空统计缓存（结果只会整体赋值，不会原地追加）
+        self._results = value
+        self._status_counts = None
+
+    def _counts(self) -> Counter:
+        """按状态统计结果数量（一次遍历，缓存到下次替换结果为止）"""
+        if self._status_counts is None:
+            self._status_counts = Counter(r.status for r in self._results)
+        return self._status_counts
+
     def get_exit_code(self) -> int:
         """获取退出码"""
         if not self.results:
             return 1
-        success_count = sum(1 for r in self.results if r.is_success)
-        return 0 if success_count > 0 else 1
+        return 0 if self.success_count > 0 else 1
 
     @property
     def success_count(self) -> int:
-        return sum(1 for r in self.results if r.is_success)
+        return self._counts()[CheckinStatus.SUCCESS]
 
     @property
     def failed_count(self) -> int:
-        return sum(1 for r in self.results if r.status == CheckinStatus.FAILED)
+        return self._counts()[CheckinStatus.FAILED]
 
     @property
     def skipped_count(self) -> int:
-        return sum(1 for r in self.results if r.status == CheckinStatus.SKIPPED)
+        return self._counts()[CheckinStatus.SKIPPED]
 
     @property
     def total_count(self) -> int:
@@ -11,55 +11,90 @@ Cookie 提取 GUI 工具
 运行方式: uv run python scripts/cookie_gui.py
 """
 
+import atexit
+import importlib
+import importlib.util
 import json
+import logging
+import logging.handlers
+import shutil
 import subprocess
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import defaultdict
 
 # 日志文件
 LOG_FILE = "cookie_extract.log"
 
+# 文件日志：保持文件句柄打开，先缓冲再批量写入（满 32 条、ERROR 或退出时落盘）
+_file_logger = logging.getLogger("cookie_extract")
+_file_logger.setLevel(logging.INFO)
+_file_logger.propagate = False
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=32,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler(LOG_FILE, encoding="utf-8", delay=True),
+)
+_file_logger.addHandler(_log_buffer)
+atexit.register(_log_buffer.flush)
+
 
 def log(message: str):
     """写入日志"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{timestamp}] {message}"
     print(log_line)
-    try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(log_line + "\n")
-    except Exception:
-        pass
+    _file_logger.info(log_line)
 
 
-def check_and_install_deps():
-    """检查并安装依赖"""
-    import importlib.util
+def flush_log():
+    """把缓冲的日志立即写入文件"""
+    _log_buffer.flush()
 
-    missing = []
 
-    if importlib.util.find_spec("customtkinter") is None:
-        missing.append("customtkinter")
+# 依赖: (模块名, 包名, 是否启动时导入)
+# rookiepy 优先；browser_cookie3 只是备用（会连带加载 pycryptodome 等），只检查是否已安装
+DEPENDENCIES = (
+    ("customtkinter", "customtkinter", True),
+    ("rookiepy", "rookiepy", True),
+    ("browser_cookie3", "browser-cookie3", False),
+)
+
 
-    # 优先使用 rookiepy
-    if importlib.util.find_spec("rookiepy") is None:
-        missing.append("rookiepy")
+def check_and_install_deps():
+    """检查并安装依赖
+
+    启动时要用的模块直接尝试导入：成功的模块留在 sys.modules 中，后面的 import 不会再查找一遍。
+    """
+    missing = []
 
-    # browser_cookie3 作为备用
-    if importlib.util.find_spec("browser_cookie3") is None:
-        missing.append("browser-cookie3")
+    for module_name, package_name, eager in DEPENDENCIES:
+        if not eager:
+            if importlib.util.find_spec(module_name) is None:
+                missing.append(package_name)
+            continue
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            missing.append(package_name)
 
     if missing:
         print(f"正在安装缺失的依赖: {', '.join(missing)}")
-        try:
-            subprocess.check_call(["uv", "add"] + missing)
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        # 先确认 uv 是否可用，未安装时直接用 pip，不再白启动一次进程
+        installers = [[sys.executable, "-m", "pip", "install"]]
+        if shutil.which("uv"):
+            installers.insert(0, ["uv", "add"])
+        for installer in installers:
             try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing)
+                subprocess.check_call(installer + missing)
+                break
             except subprocess.CalledProcessError:
-                print("\n❌ 自动安装失败，请手动运行:")
-                print(f"   uv add {' '.join(missing)}")
-                sys.exit(1)
+                continue
+        else:
+            print("\n❌ 自动安装失败，请手动运行:")
+            print(f"   uv add {' '.join(missing)}")
+            sys.exit(1)
         print("依赖安装完成，请重新运行脚本")
         sys.exit(0)
 
@@ -75,11 +110,8 @@ try:
 except ImportError:
     HAS_ROOKIEPY = False
 
-try:
-    import browser_cookie3
-    HAS_BROWSER_COOKIE3 = True
-except ImportError:
-    HAS_BROWSER_COOKIE3 = False
+# browser_cookie3 在真正用到时才导入（见 _extract_with_browser_cookie3）
+HAS_BROWSER_COOKIE3 = importlib.util.find_spec("browser_cookie3") is not None
 
 
 # 公益站配置 - 与 utils/config.py 中的 NEWAPI_SITES 保持一致
@@ -97,6 +129,26 @@ SITES_CONFIG = {
 }
 
 
+def _find_session(cookies_by_domain: dict[str, dict], domain: str) -> str | None:
+    """在按域名分组的 Cookie 中查找站点的 session
+
+    先按站点域名及其各级父域名直接查表（如 a.b.com -> b.com -> com），
+    都没有时再退回子串匹配（例如 Cookie 写在子域名上）。
+    """
+    parts = domain.split(".")
+    for i in range(len(parts)):
+        cookies = cookies_by_domain.get(".".join(parts[i:]))
+        if cookies and cookies.get("session"):
+            return cookies["session"]
+
+    for cookie_domain, cookies in cookies_by_domain.items():
+        if domain in cookie_domain or cookie_domain in domain:
+            session = cookies.get("session")
+            if session:
+                return session
+    return None
+
+
 class CookieExtractorApp(ctk.CTk):
     """Cookie 提取器主窗口"""
 
@@ -111,6 +163,8 @@ class CookieExtractorApp(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         self.accounts: list[dict] = []
+        # 复制用的紧凑 JSON，随 self.accounts 一起生成，复制时不再重复序列化
+        self._accounts_json = ""
         self.site_vars: dict[str, ctk.BooleanVar] = {}
         self.browser_var: ctk.StringVar = ctk.StringVar(value="Edge")
 
@@ -198,6 +252,8 @@ class CookieExtractorApp(ctk.CTk):
         # 站点网格
         grid_frame = ctk.CTkFrame(sites_frame, fg_color="transparent")
         grid_frame.pack(fill="x", padx=15, pady=(0, 15))
+        for col in range(3):
+            grid_frame.columnconfigure(col, weight=1)
 
         for i, (site_id, config) in enumerate(SITES_CONFIG.items()):
             row = i // 3
@@ -205,7 +261,6 @@ class CookieExtractorApp(ctk.CTk):
 
             site_frame = ctk.CTkFrame(grid_frame)
             site_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
-            grid_frame.columnconfigure(col, weight=1)
 
             var = ctk.BooleanVar(value=True)
             self.site_vars[site_id] = var
@@ -301,16 +356,10 @@ class CookieExtractorApp(ctk.CTk):
 
     def _start_extract(self):
         """开始提取"""
-        self.extract_btn.configure(state="disabled", text="⏳ 提取中...")
-        self.status_label.configure(text="正在从浏览器提取 Cookie...", text_color="yellow")
-        self.update()
-        self._do_extract()
-
-    def _do_extract(self):
-        """执行提取"""
         log("=" * 50)
         log("开始提取 Cookie")
 
+        # Tk 变量只能在主线程读取，先取出选择再交给后台线程
         selected_browser = self.browser_var.get()
         log(f"选择的浏览器: {selected_browser}")
 
@@ -323,36 +372,57 @@ class CookieExtractorApp(ctk.CTk):
             self._show_error("请至少选择一个站点")
             return
 
-        results = []
-        success_count = 0
-        fail_sites = []
+        self.extract_btn.configure(state="disabled", text="⏳ 提取中...")
+        self.status_label.configure(text="正在从浏览器提取 Cookie...", text_color="yellow")
+        self.update_idletasks()
 
-        # 优先使用 rookiepy
-        if HAS_ROOKIEPY:
-            log("使用 rookiepy 提取...")
-            results, success_count, fail_sites = self._extract_with_rookiepy(
-                selected_browser, selected_sites
-            )
-        elif HAS_BROWSER_COOKIE3:
-            log("使用 browser_cookie3 提取...")
-            results, success_count, fail_sites = self._extract_with_browser_cookie3(
-                selected_browser, selected_sites
-            )
-        else:
-            self._show_error("未安装 Cookie 提取库")
+        # 读取/解密 Cookie 数据库可能耗时数秒，放到后台线程，避免界面卡死
+        threading.Thread(
+            target=self._do_extract,
+            args=(selected_browser, selected_sites),
+            daemon=True,
+        ).start()
+
+    def _do_extract(self, selected_browser: str, selected_sites: list):
+        """执行提取（后台线程运行，界面更新通过 after 交回主线程）
+
+        线程内的异常必须在这里转换为错误提示，否则按钮会一直停在「提取中」。
+        """
+        try:
+            # 优先使用 rookiepy
+            if HAS_ROOKIEPY:
+                log("使用 rookiepy 提取...")
+                results, success_count, fail_sites = self._extract_with_rookiepy(
+                    selected_browser, selected_sites
+                )
+            elif HAS_BROWSER_COOKIE3:
+                log("使用 browser_cookie3 提取...")
+                results, success_count, fail_sites = self._extract_with_browser_cookie3(
+                    selected_browser, selected_sites
+                )
+            else:
+                self.after(0, self._show_error, "未安装 Cookie 提取库")
+                return
+        except ImportError as e:
+            # browser_cookie3 已安装但导入失败（如依赖损坏）
+            log(f"Cookie 提取库导入失败: {e}")
+            flush_log()
+            self.after(0, self._show_error, "未安装 Cookie 提取库")
+            return
+        except Exception as e:
+            log(f"提取异常: {e}")
+            flush_log()
+            self.after(0, self._show_error, f"提取失败: {e}")
             return
 
         log(f"提取完成: 成功 {success_count}, 失败 {len(fail_sites)}")
-        self._show_results(results, success_count, fail_sites)
+        flush_log()
+        self.after(0, self._show_results, results, success_count, fail_sites)
 
     def _extract_with_rookiepy(
         self, browser: str, sites: list
     ) -> tuple[list, int, list]:
         """使用 rookiepy 提取 Cookie"""
-        results = []
-        success_count = 0
-        fail_sites = []
-
         # 获取所有域名
         domains = [SITES_CONFIG[site_id]["domain"] for site_id in sites]
 
@@ -370,51 +440,21 @@ class CookieExtractorApp(ctk.CTk):
             log(f"rookiepy 获取到 {len(all_cookies)} 个 cookie")
 
             # 按域名分组
-            cookies_by_domain = {}
+            cookies_by_domain = defaultdict(dict)
             for cookie in all_cookies:
-                domain = cookie.get("domain", "").lstrip(".")
-                if domain not in cookies_by_domain:
-                    cookies_by_domain[domain] = {}
-                cookies_by_domain[domain][cookie["name"]] = cookie["value"]
-
-            # 匹配站点
-            for site_id in sites:
-                config = SITES_CONFIG[site_id]
-                domain = config["domain"]
-
-                session = None
-                for cookie_domain, cookies in cookies_by_domain.items():
-                    if domain in cookie_domain or cookie_domain in domain:
-                        session = cookies.get("session")
-                        if session:
-                            break
-
-                if session:
-                    success_count += 1
-                    results.append({
-                        "name": config["name"],
-                        "provider": site_id,
-                        "cookies": {"session": session},
-                    })
-                    log(f"  ✅ {config['name']}: 成功")
-                else:
-                    fail_sites.append(config["name"])
-                    log(f"  ❌ {config['name']}: 未找到 session")
+                cookies_by_domain[cookie.get("domain", "").lstrip(".")][cookie["name"]] = cookie["value"]
 
         except Exception as e:
             log(f"rookiepy 提取失败: {e}")
-            for site_id in sites:
-                fail_sites.append(SITES_CONFIG[site_id]["name"])
+            return [], 0, [SITES_CONFIG[site_id]["name"] for site_id in sites]
 
-        return results, success_count, fail_sites
+        return self._build_results(cookies_by_domain, sites)
 
     def _extract_with_browser_cookie3(
         self, browser: str, sites: list
     ) -> tuple[list, int, list]:
         """使用 browser_cookie3 提取 Cookie"""
-        results = []
-        success_count = 0
-        fail_sites = []
+        import browser_cookie3
 
         browser_funcs = {
             "Edge": browser_cookie3.edge,
@@ -424,31 +464,47 @@ class CookieExtractorApp(ctk.CTk):
         browser_func = browser_funcs.get(browser)
 
         if not browser_func:
-            return results, success_count, sites
+            return [], 0, sites
+
+        try:
+            # 只读取一次 Cookie 数据库（每次调用都要打开数据库并解密），再按域名分组匹配
+            cj = browser_func()
+
+            cookies_by_domain = defaultdict(dict)
+            for c in cj:
+                cookies_by_domain[c.domain.lstrip(".")][c.name] = c.value
+
+            log(f"browser_cookie3 获取到 {len(cookies_by_domain)} 个域名的 cookie")
+
+        except Exception as e:
+            log(f"browser_cookie3 提取失败: {e}")
+            return [], 0, [SITES_CONFIG[site_id]["name"] for site_id in sites]
+
+        return self._build_results(cookies_by_domain, sites)
+
+    def _build_results(
+        self, cookies_by_domain: dict[str, dict], sites: list
+    ) -> tuple[list, int, list]:
+        """按站点匹配 session，生成账号配置（两种提取方式共用）"""
+        results = []
+        success_count = 0
+        fail_sites = []
 
         for site_id in sites:
             config = SITES_CONFIG[site_id]
-            domain = config["domain"]
-
-            try:
-                cj = browser_func(domain_name=domain)
-                cookie_dict = {c.name: c.value for c in cj}
-                session = cookie_dict.get("session")
-
-                if session:
-                    success_count += 1
-                    results.append({
-                        "name": config["name"],
-                        "provider": site_id,
-                        "cookies": {"session": session},
-                    })
-                    log(f"  ✅ {config['name']}: 成功")
-                else:
-                    fail_sites.append(config["name"])
-                    log(f"  ❌ {config['name']}: 未找到 session")
-            except Exception as e:
+            session = _find_session(cookies_by_domain, config["domain"])
+
+            if session:
+                success_count += 1
+                results.append({
+                    "name": config["name"],
+                    "provider": site_id,
+                    "cookies": {"session": session},
+                })
+                log(f"  ✅ {config['name']}: 成功")
+            else:
                 fail_sites.append(config["name"])
-                log(f"  ❌ {config['name']}: {e}")
+                log(f"  ❌ {config['name']}: 未找到 session")
 
         return results, success_count, fail_sites
 
@@ -464,6 +520,7 @@ class CookieExtractorApp(ctk.CTk):
             return
 
         self.accounts = results
+        self._accounts_json = json.dumps(results, ensure_ascii=False)
         json_str = json.dumps(results, indent=2, ensure_ascii=False)
 
         self.result_text.delete("1.0", "end")
@@ -488,9 +545,8 @@ class CookieExtractorApp(ctk.CTk):
         if not self.accounts:
             return
 
-        json_str = json.dumps(self.accounts, ensure_ascii=False)
         self.clipboard_clear()
-        self.clipboard_append(json_str)
+        self.clipboard_append(self._accounts_json)
 
         self.status_label.configure(
             text="✅ 已复制到剪贴板！去 GitHub Secrets 粘贴吧",
@@ -243,7 +243,7 @@ def print_results(results: list):
         # 保存到文件
         output_file = "newapi_extracted.json"
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(results, indent=2, ensure_ascii=False))
         print(f"\n✅ 结果已保存到 {output_file}")
 
         # 生成汇总格式
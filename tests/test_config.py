@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+AppConfig.load_from_env 配置缓存的单元测试
+"""
+
+import json
+
+import pytest
+
+from utils.config import _CONFIG_ENV_VARS, AppConfig, LinuxDOAccount
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """清空相关环境变量，并在前后重置配置缓存"""
+    for name in _CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    AppConfig.invalidate_cache()
+    yield
+    AppConfig.invalidate_cache()
+
+
+def _set_linuxdo_accounts(monkeypatch, *usernames: str) -> None:
+    accounts = [{"username": u, "password": "pw"} for u in usernames]
+    monkeypatch.setenv("LINUXDO_ACCOUNTS", json.dumps(accounts))
+
+
+class TestLoadFromEnvCache:
+    """测试 load_from_env 的缓存行为"""
+
+    def test_returns_cached_object(self, monkeypatch):
+        """环境变量不变时返回同一个配置对象"""
+        _set_linuxdo_accounts(monkeypatch, "alice")
+        first = AppConfig.load_from_env()
+        assert AppConfig.load_from_env() is first
+        assert [a.username for a in first.linuxdo_accounts] == ["alice"]
+
+    def test_env_change_forces_reparse(self, monkeypatch):
+        """相关环境变量变化后重新解析"""
+        _set_linuxdo_accounts(monkeypatch, "alice")
+        first = AppConfig.load_from_env()
+
+        _set_linuxdo_accounts(monkeypatch, "alice", "bob")
+        second = AppConfig.load_from_env()
+        assert second is not first
+        assert [a.username for a in second.linuxdo_accounts] == ["alice", "bob"]
+
+    def test_invalidate_cache_resets(self, monkeypatch):
+        """invalidate_cache 后即使环境变量不变也重新解析"""
+        _set_linuxdo_accounts(monkeypatch, "alice")
+        first = AppConfig.load_from_env()
+
+        AppConfig.invalidate_cache()
+        second = AppConfig.load_from_env()
+        assert second is not first
+        assert [a.username for a in second.linuxdo_accounts] == ["alice"]
+
+
+class TestLinuxDOSimpleEnv:
+    """测试 LINUXDO_USERNAME + LINUXDO_PASSWORD 简单格式"""
+
+    def test_builds_account(self, monkeypatch):
+        """只设置用户名和密码时生成一个 LinuxDOAccount"""
+        monkeypatch.setenv("LINUXDO_USERNAME", "alice")
+        monkeypatch.setenv("LINUXDO_PASSWORD", "pw")
+        monkeypatch.setenv("LINUXDO_BROWSE", "false")
+
+        config = AppConfig.load_from_env()
+        assert len(config.linuxdo_accounts) == 1
+        account = config.linuxdo_accounts[0]
+        assert isinstance(account, LinuxDOAccount)
+        assert (account.username, account.password, account.name) == ("alice", "pw", "alice")
+        assert account.browse_linuxdo is False
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+令牌桶限速器的单元测试
+"""
+
+import time
+
+import pytest
+
+from utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """测试 TokenBucket"""
+
+    def test_invalid_rate(self):
+        """rate 必须大于 0"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_invalid_burst(self):
+        """burst 至少为 1"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+    async def test_burst_does_not_wait(self):
+        """桶满时 burst 次获取应立即完成"""
+        limiter = TokenBucket(rate=1, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    async def test_waits_when_empty(self):
+        """令牌耗尽后应等待补充"""
+        limiter = TokenBucket(rate=20, burst=1)
+        await limiter.acquire()
+        start = time.monotonic()
+        async with limiter:
+            pass
+        assert time.monotonic() - start >= 0.04
+
+    async def test_pause_delays_next_acquire(self):
+        """pause 后即使桶满也要等待暂停时长"""
+        limiter = TokenBucket(rate=100, burst=5)
+        limiter.pause(0.1)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.09
@@ -1,69 +1,51 @@
 # Shared utilities for multi-platform checkin system
 # This module contains configuration, notification, retry, and logging utilities
+#
+# Submodules are imported lazily (PEP 562): `from utils import TokenBucket` only
+# loads utils.rate_limiter, not notify/browser and their dependencies.
 
-# Import retry module
-from .retry import (
-    retry_decorator,
-    retry_with_exponential_backoff,
-    retry_with_random_delay,
-    network_retry,
-    browser_retry,
-    calculate_delay,
-)
+import importlib
 
-# Import config module
-from .config import (
-    AppConfig,
-    AnyRouterAccount,
-    ProviderConfig,
-    load_accounts_config,
-)
-
-# Import notification module
-from .notify import (
-    NotificationManager,
-    get_notification_manager,
-    push_message,
-)
-
-# Import logging module
-from .logging import (
-    setup_logging,
-    mask_sensitive_data,
-    get_logger,
-    SensitiveFilter,
-)
-
-# Import OAuth helpers module
-from .oauth_helpers import (
-    # Enums
-    OAuthURLType,
-    OAuthStep,
-    # URL classification functions
-    classify_oauth_url,
-    is_linuxdo_login_url,
-    is_authorization_url,
-    is_oauth_complete_url,
-    is_oauth_related_url,
-    # Retry utilities
-    async_retry,
-    retry_async_operation,
-    # Exception classes
-    OAuthError,
-    NavigationTimeoutError,
-    ElementNotFoundError,
-    CookieNotFoundError,
-    # Screenshot capture utilities
-    capture_error_screenshot,
-    get_debug_directory,
-    cleanup_old_screenshots,
-    DEFAULT_DEBUG_DIR,
-)
-
-# Import browser module
-from .browser import (
-    BrowserStartupError,
-)
+# 名称 -> 所在模块（按需导入）
+_LAZY_EXPORTS = {
+    "retry_decorator": "utils.retry",
+    "retry_with_exponential_backoff": "utils.retry",
+    "retry_with_random_delay": "utils.retry",
+    "network_retry": "utils.retry",
+    "browser_retry": "utils.retry",
+    "calculate_delay": "utils.retry",
+    "AppConfig": "utils.config",
+    "AnyRouterAccount": "utils.config",
+    "ProviderConfig": "utils.config",
+    "load_accounts_config": "utils.config",
+    "NotificationManager": "utils.notify",
+    "get_notification_manager": "utils.notify",
+    "push_message": "utils.notify",
+    "push_message_batch": "utils.notify",
+    "setup_logging": "utils.logging",
+    "mask_sensitive_data": "utils.logging",
+    "get_logger": "utils.logging",
+    "SensitiveFilter": "utils.logging",
+    "OAuthURLType": "utils.oauth_helpers",
+    "OAuthStep": "utils.oauth_helpers",
+    "classify_oauth_url": "utils.oauth_helpers",
+    "is_linuxdo_login_url": "utils.oauth_helpers",
+    "is_authorization_url": "utils.oauth_helpers",
+    "is_oauth_complete_url": "utils.oauth_helpers",
+    "is_oauth_related_url": "utils.oauth_helpers",
+    "async_retry": "utils.oauth_helpers",
+    "retry_async_operation": "utils.oauth_helpers",
+    "OAuthError": "utils.oauth_helpers",
+    "NavigationTimeoutError": "utils.oauth_helpers",
+    "ElementNotFoundError": "utils.oauth_helpers",
+    "CookieNotFoundError": "utils.oauth_helpers",
+    "capture_error_screenshot": "utils.oauth_helpers",
+    "get_debug_directory": "utils.oauth_helpers",
+    "cleanup_old_screenshots": "utils.oauth_helpers",
+    "DEFAULT_DEBUG_DIR": "utils.oauth_helpers",
+    "BrowserStartupError": "utils.browser",
+    "TokenBucket": "utils.rate_limiter",
+}
 
 __all__ = [
     # Config
@@ -75,6 +57,7 @@ __all__ = [
     "NotificationManager",
     "get_notification_manager",
     "push_message",
+    "push_message_batch",
     # Retry utilities
     "retry_decorator",
     "retry_with_exponential_backoff",
@@ -111,4 +94,20 @@ __all__ = [
     "DEFAULT_DEBUG_DIR",
     # Browser - Exception classes
     "BrowserStartupError",
+    # Rate limiting
+    "TokenBucket",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -597,6 +597,7 @@ class BrowserManager:
         self._drission_page = None  # DrissionPage 专用
         self._nodriver_browser = None  # nodriver 专用
         self._nodriver_tab = None  # nodriver 专用
+        self._owns_browser = True  # False 表示共享他人的浏览器进程（见 new_isolated_session）
 
     async def start(self, max_retries: int = 3):
         """启动浏览器
@@ -682,6 +683,10 @@ class BrowserManager:
             "--disable-popup-blocking",  # 禁用弹窗拦截
             "--window-size=1920,1080",   # 设置窗口大小（模拟真实用户）
             "--start-maximized",         # 最大化窗口
+            # 页面内的滚动阅读脚本依赖 setTimeout，避免后台标签页（共享浏览器的多个上下文）被节流
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-backgrounding-occluded-windows",
         ]
 
         # CI 环境额外参数
@@ -1241,8 +1246,51 @@ class BrowserManager:
             with contextlib.suppress(Exception):
                 gc.collect()
 
+    async def new_isolated_session(self) -> "BrowserManager":
+        """在当前浏览器中创建隔离的浏览器上下文（独立 Cookie 和存储）
+
+        仅支持已启动的 nodriver 浏览器。返回的 BrowserManager 与当前实例共享
+        浏览器进程，close() 时只关闭自己的标签页和上下文，不会停止浏览器。
+
+        Returns:
+            绑定到新上下文标签页的 BrowserManager
+        """
+        if self.engine != "nodriver" or not self._nodriver_browser:
+            raise BrowserStartupError(message="只有已启动的 nodriver 浏览器支持创建隔离上下文")
+
+        tab = await self._nodriver_browser.create_context(url="about:blank", new_window=False)
+
+        session = BrowserManager(engine="nodriver", headless=self.headless)
+        session._nodriver_browser = self._nodriver_browser
+        session._nodriver_tab = tab
+        session._owns_browser = False
+        return session
+
+    async def _close_isolated_session(self):
+        """关闭共享浏览器中的隔离上下文（不停止浏览器进程）"""
+        import nodriver.cdp.target as cdp_target
+
+        browser = self._nodriver_browser
+        tab = self._nodriver_tab
+        self._nodriver_browser = None
+        self._nodriver_tab = None
+        if not tab:
+            return
+
+        context_id = getattr(tab.target, "browser_context_id", None)
+        with contextlib.suppress(Exception):
+            await tab.close()
+        if browser and context_id:
+            with contextlib.suppress(Exception):
+                await browser.send(cdp_target.dispose_browser_context(context_id))
+
     async def close(self):
         """关闭浏览器"""
+        if self.engine == "nodriver" and not self._owns_browser:
+            await self._close_isolated_session()
+            logger.debug("隔离上下文已关闭")
+            return
+
         if self.engine == "nodriver":
             await self._stop_nodriver_browser()
         elif self.engine == "drissionpage":
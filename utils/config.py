@@ -12,6 +12,7 @@ Requirements:
 - 3.6: 缺少必需配置时记录描述性错误并跳过该平台
 """
 
+import functools
 import json
 import os
 from dataclasses import dataclass, field
@@ -19,6 +20,15 @@ from typing import Literal
 
 from loguru import logger
 
+# 优先使用 orjson 解析账号 JSON（C 实现，账号较多时更快）；未安装时回退到标准库。
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，下方的异常处理无需区分。
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 @dataclass
 class AnyRouterAccount:
@@ -283,6 +293,7 @@ class LinuxDOAccount:
         - 支持格式：{"_forum_session": "xxx", "_t": "xxx"} 或 "_forum_session=xxx; _t=xxx"
     - name: 账号显示名称（可选）
     - browse_minutes: 浏览时长（分钟，可选，默认 20）
+    - browse_linuxdo: 是否浏览 LinuxDO 帖子（可选，默认 true）
     - sites: 要签到的站点列表（可选，默认空，仅浏览主站）
     - checkin_sites: 要签到的 NewAPI 站点列表（可选，白名单模式）
         - 空列表 / 不设置 → 签到所有可用站点（默认行为）
@@ -301,6 +312,7 @@ class LinuxDOAccount:
     checkin_sites: list[str] = field(default_factory=list)  # 空=签到所有站点，非空=仅签到指定站点（白名单）
     exclude_sites: list[str] = field(default_factory=list)  # 空=不排除，非空=跳过指定站点（黑名单）
     browse_minutes: int = 20  # 浏览时长（分钟），默认 20 分钟
+    browse_linuxdo: bool = True  # 是否浏览帖子，关闭后仅用于站点签到
     name: str | None = None
 
     @classmethod
@@ -326,6 +338,10 @@ class LinuxDOAccount:
         # 获取 cookies（支持字典或字符串格式）
         cookies = data.get("cookies")
 
+        browse_linuxdo = data.get("browse_linuxdo", True)
+        if isinstance(browse_linuxdo, str):
+            browse_linuxdo = browse_linuxdo.lower() == "true"
+
         return cls(
             username=data.get("username"),
             password=data.get("password"),
@@ -334,6 +350,7 @@ class LinuxDOAccount:
             checkin_sites=checkin_sites,
             exclude_sites=exclude_sites,
             browse_minutes=browse_minutes,
+            browse_linuxdo=bool(browse_linuxdo),
             name=name,
         )
 
@@ -543,6 +560,27 @@ DEFAULT_PROVIDERS: dict[str, dict] = {
 }
 
 
+# AppConfig.load_from_env 读取的环境变量；其取值作为配置缓存的键，任一变化都会重新解析
+_CONFIG_ENV_VARS = (
+    "WONG_ACCOUNTS",
+    "ELYSIVER_ACCOUNTS",
+    "KFCAPI_ACCOUNTS",
+    "DUCKCODING_ACCOUNTS",
+    "LINUXDO_ACCOUNTS",
+    "LINUXDO_USERNAME",
+    "LINUXDO_PASSWORD",
+    "LINUXDO_BROWSE",
+    "NEWAPI_ACCOUNTS",
+    "PROVIDERS",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_app_config_cached(cls: type["AppConfig"], env_values: tuple[str | None, ...]) -> "AppConfig":  # noqa: ARG001
+    """按环境变量取值缓存的配置加载（env_values 仅作为缓存键）"""
+    return cls._load_from_env_uncached()
+
+
 @dataclass
 class AppConfig:
     """应用配置 - 统一管理所有平台配置"""
@@ -562,7 +600,21 @@ class AppConfig:
         两种使用模式：
         1. 手动模式：设置 NEWAPI_ACCOUNTS（指定每个站点的 Cookie）
         2. 自动模式：只设置 LINUXDO_ACCOUNTS（系统自动遍历所有站点 OAuth 签到）
+
+        相关环境变量不变时返回缓存的同一个配置对象，不再重复解析账号 JSON；
+        需要强制重新加载时调用 invalidate_cache()。
         """
+        env_values = tuple(os.environ.get(name) for name in _CONFIG_ENV_VARS)
+        return _load_app_config_cached(cls, env_values)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """清空 load_from_env 的缓存（主要用于测试）"""
+        _load_app_config_cached.cache_clear()
+
+    @classmethod
+    def _load_from_env_uncached(cls) -> "AppConfig":
+        """从环境变量解析完整配置（不走缓存）"""
         wong_accounts = cls._load_wong_accounts()
         elysiver_accounts = cls._load_elysiver_accounts()
         kfcapi_accounts = cls._load_kfcapi_accounts()
@@ -599,7 +651,7 @@ class AppConfig:
         accounts_str = os.getenv("WONG_ACCOUNTS")
         if accounts_str:
             try:
-                accounts_data = json.loads(accounts_str)
+                accounts_data = _json_loads(accounts_str)
 
                 if not isinstance(accounts_data, list):
                     logger.error("WONG_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -630,7 +682,7 @@ class AppConfig:
         accounts_str = os.getenv("ELYSIVER_ACCOUNTS")
         if accounts_str:
             try:
-                accounts_data = json.loads(accounts_str)
+                accounts_data = _json_loads(accounts_str)
 
                 if not isinstance(accounts_data, list):
                     logger.error("ELYSIVER_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -661,7 +713,7 @@ class AppConfig:
         accounts_str = os.getenv("KFCAPI_ACCOUNTS")
         if accounts_str:
             try:
-                accounts_data = json.loads(accounts_str)
+                accounts_data = _json_loads(accounts_str)
 
                 if not isinstance(accounts_data, list):
                     logger.error("KFCAPI_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -691,7 +743,7 @@ class AppConfig:
         accounts_str = os.getenv("DUCKCODING_ACCOUNTS")
         if accounts_str:
             try:
-                accounts_data = json.loads(accounts_str)
+                accounts_data = _json_loads(accounts_str)
 
                 if not isinstance(accounts_data, list):
                     logger.error("DUCKCODING_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -738,7 +790,7 @@ class AppConfig:
         accounts_str = os.getenv("LINUXDO_ACCOUNTS")
         if accounts_str:
             try:
-                accounts_data = json.loads(accounts_str)
+                accounts_data = _json_loads(accounts_str)
 
                 if not isinstance(accounts_data, list):
                     logger.error("LINUXDO_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -775,14 +827,12 @@ class AppConfig:
         if username and password:
             # 从环境变量读取可选配置
             browse_linuxdo = os.getenv("LINUXDO_BROWSE", "true").lower() == "true"
-            browse_count = int(os.getenv("LINUXDO_BROWSE_COUNT", "10"))
 
             accounts.append(LinuxDOAccount(
                 username=username,
                 password=password,
                 sites=list(NEWAPI_SITES.keys()),
                 browse_linuxdo=browse_linuxdo,
-                browse_count=browse_count,
                 name=username,
             ))
             logger.info(f"成功加载 LinuxDO 账号: {username} (签到所有站点, 浏览帖子: {browse_linuxdo})")
@@ -810,7 +860,7 @@ class AppConfig:
             return []
 
         try:
-            accounts_data = json.loads(accounts_str)
+            accounts_data = _json_loads(accounts_str)
 
             if not isinstance(accounts_data, list):
                 logger.error("NEWAPI_ACCOUNTS 配置格式错误: 必须是 JSON 数组格式")
@@ -865,7 +915,7 @@ class AppConfig:
         providers_str = os.getenv("PROVIDERS")
         if providers_str:
             try:
-                providers_data = json.loads(providers_str)
+                providers_data = _json_loads(providers_str)
                 if not isinstance(providers_data, dict):
                     logger.warning("PROVIDERS 必须是 JSON 对象格式")
                     return providers
@@ -667,15 +667,21 @@ class NotificationManager:
         if timestamp is None:
             timestamp = get_beijing_time()
 
-        success_count = sum(1 for r in results if r.get("status") == "success")
-        failed_count = sum(1 for r in results if r.get("status") == "failed")
         total_count = len(results)
 
-        # 动态按 provider 分组
+        # 动态按 provider 分组（同一次遍历中统计成功/失败数）
         provider_groups: dict[str, list[dict]] = {}
         linuxdo_results = []
+        success_count = 0
+        failed_count = 0
 
         for r in results:
+            status = r.get("status")
+            if status == "success":
+                success_count += 1
+            elif status == "failed":
+                failed_count += 1
+
             platform = r.get("platform", "")
             if "LinuxDO" in platform:
                 linuxdo_results.append(r)
@@ -936,3 +942,28 @@ def push_message(
     """
     with NotificationManager() as manager:
         return manager.push_message(title, content, msg_type)
+
+
+def push_message_batch(
+    title: str,
+    items: list[str],
+    msg_type: Literal["text", "html"] = "text"
+) -> dict[str, bool]:
+    """将多条结果合并为一条通知发送（便捷函数）
+
+    多账号场景下应先收集每个账号的结果行，最后统一调用本函数，
+    无论账号数量多少都只产生一次推送请求。
+
+    Args:
+        title: 通知标题
+        items: 结果行列表（空行会被忽略）
+        msg_type: 消息类型，"text" 或 "html"
+
+    Returns:
+        dict: 各渠道发送结果；没有任何结果行时不发送，返回空字典
+    """
+    lines = [item for item in items if item]
+    if not lines:
+        return {}
+    separator = "<br>" if msg_type == "html" else "\n"
+    return push_message(title, separator.join(lines), msg_type)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+令牌桶限速模块
+
+平滑请求节奏，避免短时间突发请求触发站点的反滥用机制（429 / 验证码）。
+多个协程可以共享同一个限速器实例。
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """异步令牌桶限速器
+
+    令牌以 rate 个/秒的速度补充，最多累积 burst 个；
+    每次 acquire() 消耗一个令牌，没有令牌时等待补充。
+
+    Example:
+        limiter = TokenBucket(rate=2, burst=4)
+        await limiter.acquire()
+        await tab.get(url)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数（必须大于 0）
+            burst: 桶容量，即允许的最大突发请求数
+        """
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        if burst < 1:
+            raise ValueError("burst 必须至少为 1")
+
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """按经过的时间补充令牌"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """获取一个令牌，必要时等待"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """暂停发放令牌 seconds 秒（例如收到 429 时）
+
+        通过把令牌数降为负值实现：所有共享此限速器的协程都会在
+        暂停结束后才拿到下一个令牌，之后按 rate 恢复节奏，不会集中突发。
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False